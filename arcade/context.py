@@ -226,6 +226,8 @@ def reset(self) -> None:
         self.enable_only(self.BLEND)
         self.blend_func = self.BLEND_DEFAULT
         self.point_size = 1.0
+        # Texture array bindings may have been changed by other OpenGL code
+        self._bound_textures.clear()
 
     def bind_window_block(self) -> None:
         """
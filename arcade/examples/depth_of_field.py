@@ -10,7 +10,8 @@
 This example works by doing the following for each frame:
 
 1. Render a depth value for pixel into a buffer
-2. Render a gaussian blurred version of the scene
+2. Render a blurred version of the scene by repeatedly downsampling
+   and then upsampling it (dual filtering)
 3. For each pixel, use the current depth value to lerp between the
    blurred and un-blurred versions of the scene.
 
@@ -35,8 +36,15 @@
 from arcade import get_window, SpriteList, SpriteSolidColor, Text, Window, View
 from arcade.camera.data_types import DEFAULT_NEAR_ORTHO, DEFAULT_FAR
 from arcade.color import RED
-from arcade.experimental.postprocessing import GaussianBlur
-from arcade.gl import NEAREST, Program, Texture2D, geometry
+from arcade.gl import (
+    CLAMP_TO_EDGE,
+    LINEAR,
+    NEAREST,
+    Framebuffer,
+    Program,
+    Texture2D,
+    geometry,
+)
 from arcade.types import RGBA255, Color
 
 WINDOW_TITLE = "Depth of Field Example"
@@ -44,6 +52,116 @@
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 BACKGROUND_GRAY = Color(155, 155, 155, 255)
+SPRITE_COUNT = 100
+# How many frames to wait between focus label updates
+LABEL_UPDATE_INTERVAL = 4
+# Number of samples in one period of the focus oscillation (power of two)
+FOCUS_LUT_SIZE = 1024
+
+# To keep this example in one file, we use strings for our
+# our shaders. You may want to use pathlib.Path.read_text in
+# your own code instead.
+VERTEX_SHADER = dedent(
+    """#version 330
+
+    in vec2 in_vert;
+    in vec2 in_uv;
+
+    out vec2 out_uv;
+
+    void main(){
+       gl_Position = vec4(in_vert, 0.0, 1.0);
+       out_uv = in_uv;
+    }"""
+)
+
+FRAGMENT_SHADER = dedent(
+    """#version 330
+
+    uniform sampler2D texture_0;
+    uniform sampler2D texture_1;
+    uniform sampler2D depth_0;
+
+    uniform float focus_depth;
+
+    in vec2 out_uv;
+
+    out vec4 frag_colour;
+
+    void main() {
+       float depth_val = texture(depth_0, out_uv).x;
+       // Squaring the distance avoids abs() and maps to a single fma + clamp.
+       // Like 2.0 * abs(delta) it reaches full blur at a distance of 0.5.
+       float delta = depth_val - focus_depth;
+       float depth_adjusted = clamp(4.0 * delta * delta, 0.0, 1.0);
+       vec3 crisp = texture(texture_0, out_uv).rgb;
+       vec3 blurred = texture(texture_1, out_uv).rgb;
+       frag_colour = vec4(mix(crisp, blurred, depth_adjusted), 1.0);
+       //if (depth_adjusted < 0.1){frag_colour = vec4(1.0, 0.0, 0.0, 1.0);}
+    }"""
+)
+
+# Dual filter blur passes. Each sample is a bilinear read between
+# texels, so a few samples cover a wide area of the source.
+# See "Bandwidth-Efficient Rendering" by Marius Bjorge, SIGGRAPH 2015.
+DOWNSAMPLE_SHADER = dedent(
+    """#version 330
+
+    uniform sampler2D texture_0;
+
+    in vec2 out_uv;
+
+    out vec4 frag_colour;
+
+    void main() {
+       vec2 texel = 1.0 / vec2(textureSize(texture_0, 0));
+       vec3 sum = texture(texture_0, out_uv).rgb * 4.0;
+       sum += texture(texture_0, out_uv - texel).rgb;
+       sum += texture(texture_0, out_uv + texel).rgb;
+       sum += texture(texture_0, out_uv + vec2(texel.x, -texel.y)).rgb;
+       sum += texture(texture_0, out_uv - vec2(texel.x, -texel.y)).rgb;
+       frag_colour = vec4(sum / 8.0, 1.0);
+    }"""
+)
+
+UPSAMPLE_SHADER = dedent(
+    """#version 330
+
+    uniform sampler2D texture_0;
+
+    in vec2 out_uv;
+
+    out vec4 frag_colour;
+
+    void main() {
+       vec2 h = 0.5 / vec2(textureSize(texture_0, 0));
+       vec3 sum = texture(texture_0, out_uv + vec2(-h.x * 2.0, 0.0)).rgb;
+       sum += texture(texture_0, out_uv + vec2(-h.x, h.y)).rgb * 2.0;
+       sum += texture(texture_0, out_uv + vec2(0.0, h.y * 2.0)).rgb;
+       sum += texture(texture_0, out_uv + vec2(h.x, h.y)).rgb * 2.0;
+       sum += texture(texture_0, out_uv + vec2(h.x * 2.0, 0.0)).rgb;
+       sum += texture(texture_0, out_uv + vec2(h.x, -h.y)).rgb * 2.0;
+       sum += texture(texture_0, out_uv + vec2(0.0, -h.y * 2.0)).rgb;
+       sum += texture(texture_0, out_uv + vec2(-h.x, -h.y)).rgb * 2.0;
+       frag_colour = vec4(sum / 12.0, 1.0);
+    }"""
+)
+
+# Copies the depth buffer into a single channel 8 bit texture
+DEPTH_COPY_SHADER = dedent(
+    """#version 330
+
+    uniform sampler2D depth_0;
+
+    in vec2 out_uv;
+
+    out vec4 frag_colour;
+
+    void main() {
+       // Alpha must be 1.0 so blending, if left enabled, writes the depth as is
+       frag_colour = vec4(texture(depth_0, out_uv).x, 0.0, 0.0, 1.0);
+    }"""
+)
 
 
 class DepthOfField:
@@ -54,106 +172,210 @@ class DepthOfField:
             The size of the buffers.
         clear_color:
             The color which will be used as the background.
+        blur_levels:
+            How many times the scene is halved in size while blurring.
+            More levels make a wider blur. Levels stop once the
+            buffers are 1x1 pixel.
     """
 
+    # Compiled programs keyed by (context id, vertex_shader, fragment_shader)
+    _PROGRAM_CACHE: dict[tuple[int, str, str], Program] = {}
+
     def __init__(
         self,
         size: tuple[int, int] | None = None,
-        clear_color: RGBA255 = BACKGROUND_GRAY
+        clear_color: RGBA255 = BACKGROUND_GRAY,
+        blur_levels: int = 2,
     ):
-        self._geo = geometry.quad_2d_fs()
         self._win: Window = get_window()
+        self._geo = geometry.quad_2d_fs()
 
         size = cast(tuple[int, int], size or self._win.size)
         self._clear_color: Color = Color.from_iterable(clear_color)
 
         self.stale = True
+        self._blur_levels = max(1, blur_levels)
 
-        # Set up our depth buffer to hold per-pixel depth
-        self._render_target = self._win.ctx.framebuffer(
-            color_attachments=[
-                self._win.ctx.texture(
-                    size,
-                    components=4,
-                    filter=(NEAREST, NEAREST),
-                    wrap_x=self._win.ctx.REPEAT,
-                    wrap_y=self._win.ctx.REPEAT,
-                ),
-            ],
-            depth_attachment=self._win.ctx.depth_texture(size),
-        )
-
-        # Set up everything we need to perform blur and store results.
-        # This includes the blur effect, a framebuffer, and an instance
-        # variable to store the returned texture holding blur results.
-        self._blur_process = GaussianBlur(size, kernel_size=10, sigma=2.0, multiplier=2.0, step=4)
-        self._blur_target = self._win.ctx.framebuffer(
-            color_attachments=[
-                self._win.ctx.texture(
-                    size,
-                    components=4,
-                    filter=(NEAREST, NEAREST),
-                    wrap_x=self._win.ctx.REPEAT,
-                    wrap_y=self._win.ctx.REPEAT,
-                )
-            ]
-        )
+        self._size: tuple[int, int] = (0, 0)
+        # Render targets keyed by (width, height, components, filter, wrap, depth).
+        # They are drawn into, so each effect has its own. Resizing reuses the
+        # buffers whose size didn't change.
+        self._fbo_cache: dict[tuple, Framebuffer] = {}
         self._blurred: Texture2D | None = None
+        self.resize(size)
 
-        # To keep this example in one file, we use strings for our
-        # our shaders. You may want to use pathlib.Path.read_text in
-        # your own code instead.
-        self._render_program = self._win.ctx.program(
-            vertex_shader=dedent(
-                """#version 330
-
-                in vec2 in_vert;
-                in vec2 in_uv;
-
-                out vec2 out_uv;
-
-                void main(){
-                   gl_Position = vec4(in_vert, 0.0, 1.0);
-                   out_uv = in_uv;
-                }"""
-            ),
-            fragment_shader=dedent(
-                """#version 330
-
-                uniform sampler2D texture_0;
-                uniform sampler2D texture_1;
-                uniform sampler2D depth_0;
-
-                uniform float focus_depth;
-
-                in vec2 out_uv;
-
-                out vec4 frag_colour;
-
-                void main() {
-                   float depth_val = texture(depth_0, out_uv).x;
-                   float depth_adjusted = min(1.0, 2.0 * abs(depth_val - focus_depth));
-                   vec4 crisp_tex = texture(texture_0, out_uv);
-                   vec3 blur_tex = texture(texture_1, out_uv).rgb;
-                   frag_colour = mix(crisp_tex, vec4(blur_tex, crisp_tex.a), depth_adjusted);
-                   //if (depth_adjusted < 0.1){frag_colour = vec4(1.0, 0.0, 0.0, 1.0);}
-                }"""
-            ),
+        # The composite program holds this effect's focus, so it isn't shared.
+        # The blur and copy programs have no per-effect state.
+        program = self._win.ctx.program(
+            vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER
         )
-
-        # Set the buffers the shader program will use
-        self._render_program["texture_0"] = 0
-        self._render_program["texture_1"] = 1
-        self._render_program["depth_0"] = 2
+        # Set the buffers the shader programs will use
+        program["texture_0"] = 0
+        program["texture_1"] = 1
+        program["depth_0"] = 2
+        program["focus_depth"] = 0.0
+        self._render_program = program
+
+        self._downsample_program = self._get_program(VERTEX_SHADER, DOWNSAMPLE_SHADER)
+        self._upsample_program = self._get_program(VERTEX_SHADER, UPSAMPLE_SHADER)
+
+        self._depth_copy_program = self._get_program(VERTEX_SHADER, DEPTH_COPY_SHADER)
+        self._depth_copy_program["depth_0"] = 0
+
+        self._focus_depth = 0.0
+
+    @classmethod
+    def _get_program(cls, vertex_shader: str, fragment_shader: str) -> Program:
+        """Get a cached program or compile one.
+
+        Compiling and linking is expensive, so effects in the same
+        context share their programs.
+
+        Args:
+            vertex_shader:
+                The vertex shader source.
+            fragment_shader:
+                The fragment shader source.
+        """
+        ctx = get_window().ctx
+        key = (id(ctx), vertex_shader, fragment_shader)
+        program = cls._PROGRAM_CACHE.get(key)
+        # A new context can get the id of a closed one, so check the owner too
+        if program is None or program.ctx is not ctx:
+            program = ctx.program(
+                vertex_shader=vertex_shader, fragment_shader=fragment_shader
+            )
+            cls._PROGRAM_CACHE[key] = program
+
+        return program
+
+    @staticmethod
+    def _fbo_key(
+        size: tuple[int, int],
+        components: int = 4,
+        filter: tuple[int, int] = (LINEAR, LINEAR),
+        wrap: int = CLAMP_TO_EDGE,
+        depth: bool = False,
+    ) -> tuple:
+        """The cache key of a framebuffer."""
+        return (*size, components, filter, wrap, depth)
+
+    def _get_fbo(
+        self,
+        size: tuple[int, int],
+        components: int = 4,
+        filter: tuple[int, int] = (LINEAR, LINEAR),
+        wrap: int = CLAMP_TO_EDGE,
+        depth: bool = False,
+    ) -> Framebuffer:
+        """Get a cached framebuffer or create one.
+
+        Args:
+            size:
+                The size of the framebuffer.
+            components:
+                The number of components in the color attachment.
+            filter:
+                The filter of the color attachment.
+            wrap:
+                The wrap mode of the color attachment.
+            depth:
+                Also create a depth attachment.
+        """
+        key = self._fbo_key(size, components, filter, wrap, depth)
+        fbo = self._fbo_cache.get(key)
+        if fbo is None:
+            ctx = self._win.ctx
+            fbo = ctx.framebuffer(
+                color_attachments=[
+                    ctx.texture(
+                        size,
+                        components=components,
+                        filter=filter,
+                        wrap_x=wrap,
+                        wrap_y=wrap,
+                    )
+                ],
+                depth_attachment=ctx.depth_texture(size) if depth else None,
+            )
+            self._fbo_cache[key] = fbo
+
+        return fbo
+
+    def resize(self, size: tuple[int, int]):
+        """Resize the buffers used by the effect.
+
+        Buffers which keep their size are reused. The others are released.
+
+        Args:
+            size:
+                The new size of the buffers.
+        """
+        if size == self._size:
+            return
+
+        self._size = size
+        self.invalidate()
+
+        # Set up our depth buffer to hold per-pixel depth.
+        # The scene is opaque, so we skip the alpha channel to save memory.
+        self._render_target = self._get_fbo(size, components=3, depth=True)
+        fbo_keys = [self._fbo_key(size, components=3, depth=True)]
+
+        # Each blur level is half the size of the previous one. They are
+        # used as scratch buffers by both the downsample and upsample passes.
+        self._blur_pyramid: list[Framebuffer] = []
+        level_size = size
+        for _ in range(self._blur_levels):
+            next_size = (max(1, level_size[0] // 2), max(1, level_size[1] // 2))
+            # A level of the same size would share the previous level's
+            # buffer, so a pass would read and write the same texture.
+            if self._blur_pyramid and next_size == level_size:
+                break
+            level_size = next_size
+            self._blur_pyramid.append(self._get_fbo(level_size, components=3))
+            fbo_keys.append(self._fbo_key(level_size, components=3))
+
+        # The depth buffer is 24 bits or more per pixel, but 8 bits is
+        # plenty for picking the blur amount. We copy it into a smaller
+        # buffer so the composite pass reads less memory.
+        depth_filter = (NEAREST, NEAREST)
+        self._depth_r8 = self._get_fbo(size, components=1, filter=depth_filter)
+
+        fbo_keys.append(self._fbo_key(size, components=1, filter=depth_filter))
+
+        # Release the buffers of the old size
+        for key in list(self._fbo_cache):
+            if key not in fbo_keys:
+                del self._fbo_cache[key]
 
     @property
     def render_program(self) -> Program:
         """The compiled shader for this effect."""
         return self._render_program
 
+    @property
+    def focus_depth(self) -> float:
+        """The normalized depth (``0.0`` to ``1.0``) which is in focus."""
+        return self._focus_depth
+
+    @focus_depth.setter
+    def focus_depth(self, value: float):
+        # Only touch the program when the focus actually moves
+        if value != self._focus_depth:
+            self._focus_depth = value
+            self._render_program["focus_depth"] = value
+
+    def invalidate(self):
+        """Mark the blurred scene as outdated.
+
+        Call this when the scene drawn into the effect has changed.
+        The blur will then be re-processed on the next :py:meth:`render`.
+        """
+        self.stale = True
+
     @contextmanager
     def draw_into(self):
-        self.stale = True
         previous_fbo = self._win.ctx.active_framebuffer
         try:
             self._win.ctx.enable(self._win.ctx.DEPTH_TEST)
@@ -164,19 +386,50 @@ def draw_into(self):
             self._win.ctx.disable(self._win.ctx.DEPTH_TEST)
             previous_fbo.use()
 
+    def _dual_filter(self, source: Texture2D) -> Texture2D:
+        """Blur a texture by downsampling and then upsampling it.
+
+        Args:
+            source:
+                The texture to blur.
+        """
+        for fbo in self._blur_pyramid:
+            fbo.use()
+            source.use(0)
+            self._geo.render(self._downsample_program)
+            source = fbo.color_attachments[0]
+
+        for fbo in reversed(self._blur_pyramid[:-1]):
+            fbo.use()
+            source.use(0)
+            self._geo.render(self._upsample_program)
+            source = fbo.color_attachments[0]
+
+        return source
+
     def process(self):
-        self._blurred = self._blur_process.render(self._render_target.color_attachments[0])
-        self._win.use()
+        """Update the blurred version of the scene."""
+        previous_fbo = self._win.ctx.active_framebuffer
+        self._blurred = self._dual_filter(self._render_target.color_attachments[0])
+
+        self._depth_r8.use()
+        self._render_target.depth_attachment.use(0)
+        self._geo.render(self._depth_copy_program)
+        previous_fbo.use()
 
         self.stale = False
 
     def render(self):
+        """Draw the scene with the effect applied to the active framebuffer.
+
+        The blur is only re-processed if the effect is stale.
+        """
         if self.stale:
             self.process()
 
         self._render_target.color_attachments[0].use(0)
         self._blurred.use(1)
-        self._render_target.depth_attachment.use(2)
+        self._depth_r8.color_attachments[0].use(2)
         self._geo.render(self._render_program)
 
 
@@ -214,6 +467,11 @@ def __init__(
         self._batch = Batch()
         self.focus_range: float = focus_range
         self.focus_change_speed: float = focus_change_speed
+        # One period of the focus oscillation sampled into a lookup table
+        self._focus_lut = [
+            cos(2.0 * pi * i / FOCUS_LUT_SIZE) * 0.5 + 0.5 for i in range(FOCUS_LUT_SIZE)
+        ]
+        self._focus_period = 2.0 / focus_change_speed if focus_change_speed else 0.0
         self.indicator_label = Text(
             f"Focus depth: {0:.3f} / {focus_range}",
             self.width / 2,
@@ -223,9 +481,13 @@ def __init__(
             anchor_x="center",
             batch=self._batch,
         )
+        # Re-laying out text is expensive, so only do it when it changes
+        self._last_focus_str: str | None = None
+        self._label_frame_counter = 0
 
         # Randomize sprite depth, size, and angle, but set color from depth.
-        for _ in range(100):
+        sprites = []
+        for _ in range(SPRITE_COUNT):
             depth = uniform(min_sprite_depth, max_sprite_depth)
             color = Color.from_gray(int(255 * (depth + 100) / 200))
             s = SpriteSolidColor(
@@ -237,15 +499,41 @@ def __init__(
                 uniform(0, 360),
             )
             s.depth = depth
-            self.sprites.append(s)
+            sprites.append(s)
+
+        # Draw the nearest sprites (highest depth) first. Pixels hidden
+        # behind them then fail the depth test before being shaded.
+        sprites.sort(key=lambda sprite: sprite.depth, reverse=True)
+        self.sprites.extend(sprites)
 
         self.dof = DepthOfField()
+        # The sprites never move after creation, so the blur only needs
+        # to be processed again when this flag is set.
+        self.sprites_dirty = True
 
     def on_update(self, delta_time: float):
         time = self.window.time
-        raw_focus = self.focus_range * (cos(pi * self.focus_change_speed * time) * 0.5 + 0.5)
-        self.dof.render_program["focus_depth"] = raw_focus / self.focus_range
-        self.indicator_label.value = f"Focus depth: {raw_focus:.3f} / {self.focus_range}"
+        if self._focus_period:
+            phase = (time % self._focus_period) / self._focus_period
+            index = int(phase * FOCUS_LUT_SIZE) & (FOCUS_LUT_SIZE - 1)
+        else:
+            index = 0
+        raw_focus = self.focus_range * self._focus_lut[index]
+        self.dof.focus_depth = raw_focus / self.focus_range
+
+        self._label_frame_counter += 1
+        if self._label_frame_counter < LABEL_UPDATE_INTERVAL:
+            return
+        self._label_frame_counter = 0
+
+        focus_str = f"{raw_focus:.3f}"
+        if focus_str != self._last_focus_str:
+            self._last_focus_str = focus_str
+            self.indicator_label.value = f"Focus depth: {focus_str} / {self.focus_range}"
+
+    def on_resize(self, width: int, height: int):
+        # Resize the buffers instead of re-creating the effect
+        self.dof.resize((width, height))
 
     def on_draw(self):
         self.clear()
@@ -253,6 +541,9 @@ def on_draw(self):
         # Render the depth-of-field layer's frame buffer
         with self.dof.draw_into():
             self.sprites.draw(pixelated=True)
+        if self.sprites_dirty:
+            self.dof.invalidate()
+            self.sprites_dirty = False
 
         # Draw the blurred frame buffer and then the focus display
         window = self.window
@@ -50,3 +50,30 @@ def gaussian_kernel(kernel_size: int = 5, sigma: float = 1, mu: float = 0, step:
         coeff[i] *= sum_norm
 
     return coeff
+
+
+def linear_sampled_kernel(kernel: list[float]) -> tuple[list[float], list[float]]:
+    """
+    Fold a symmetric kernel into weights and offsets for linear sampling.
+
+    Neighboring taps on one side of the kernel are merged into a single
+    bilinear fetch placed at the weighted offset between the two texels.
+    Index 0 is the center tap at offset 0. The shader is expected to apply
+    every other weight on both sides of the center.
+    See: https://www.rastergrid.com/blog/2010/09/efficient-gaussian-blur-with-linear-sampling/
+
+    Args:
+        kernel: Symmetric kernel with an odd number of coefficients
+    """
+    center = len(kernel) // 2
+    side = kernel[center:]
+    weights = [side[0]]
+    offsets = [0.0]
+    for i in range(1, len(side), 2):
+        w1 = side[i]
+        w2 = side[i + 1] if i + 1 < len(side) else 0.0
+        weight = w1 + w2
+        weights.append(weight)
+        offsets.append((i * w1 + (i + 1) * w2) / weight)
+
+    return weights, offsets
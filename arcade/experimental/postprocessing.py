@@ -6,11 +6,24 @@
 
 from arcade import get_window
 from arcade.context import ArcadeContext
-from arcade.experimental.gaussian_kernel import gaussian_kernel
-from arcade.gl import geometry
+from arcade.experimental.gaussian_kernel import gaussian_kernel, linear_sampled_kernel
+from arcade.gl import Geometry, geometry
 from arcade.gl.texture import Texture2D
 
 
+# Full screen quads shared by every effect in a context, keyed by the context's id()
+_FS_QUADS: dict[int, Geometry] = {}
+
+
+def _fs_quad(ctx: ArcadeContext) -> Geometry:
+    """Get a full screen quad shared by every effect using ``ctx``"""
+    quad = _FS_QUADS.get(id(ctx))
+    # A new context can get the id of a closed one, so check the owner too
+    if quad is None or quad.ctx is not ctx:
+        quad = _FS_QUADS[id(ctx)] = geometry.quad_2d_fs()
+    return quad
+
+
 class PostProcessing:
     """Base class"""
 
@@ -55,6 +68,10 @@ def resize(self, size: tuple[int, int]):
 
 class GaussianBlurPass(PostProcessing):
 
+    #: Size and sigma of the kernel the blur shaders are sampling with
+    SHADER_KERNEL_SIZE = 11
+    SHADER_KERNEL_SIGMA = 3.0
+
     def __init__(self, size, kernel_size=5, sigma=2, multiplier=0, step=1):
         super().__init__(size)
         self._kernel_size = kernel_size
@@ -78,6 +95,11 @@ def _create_kernel(self):
 
         return {"KERNEL_SIZE": str(self._kernel_size), "MY_KERNEL": kernel_string}
 
+    def _create_linear_kernel(self) -> tuple[list[float], list[float]]:
+        """Create the linear sampled weights and offsets for the shader"""
+        kernel = gaussian_kernel(self.SHADER_KERNEL_SIZE, self.SHADER_KERNEL_SIGMA)
+        return linear_sampled_kernel(kernel)
+
 
 class GaussianBlurHorizontal(GaussianBlurPass):
     """Blur the buffer horizontally."""
@@ -93,7 +115,16 @@ def __init__(self, size: tuple[int, int], kernel_size=5, sigma=2, multiplier=1,
             vertex_shader=":system:shaders/texture_default_projection_vs.glsl",
             fragment_shader=":system:shaders/postprocessing/gaussian_blur_x_fs.glsl",
         )
-        self._quad_fs = geometry.quad_2d_fs()
+        weights, offsets = self._create_linear_kernel()
+        self._program["weights"] = weights
+        self._program["offsets"] = offsets
+        self._quad_fs = _fs_quad(self.ctx)
+
+    def resize(self, size: tuple[int, int]):
+        """Resize the blur buffer."""
+        super().resize(size)
+        self._fbo.color_attachments[0].resize(size)
+        self._fbo.resize()
 
     def render(self, source: Texture2D) -> Texture2D:
         """Render"""
@@ -124,7 +155,16 @@ def __init__(self, size: tuple[int, int], kernel_size=5, sigma=2, multiplier=1,
             vertex_shader=":system:shaders/texture_default_projection_vs.glsl",
             fragment_shader=":system:shaders/postprocessing/gaussian_blur_y_fs.glsl",
         )
-        self._quad_fs = geometry.quad_2d_fs()
+        weights, offsets = self._create_linear_kernel()
+        self._program["weights"] = weights
+        self._program["offsets"] = offsets
+        self._quad_fs = _fs_quad(self.ctx)
+
+    def resize(self, size: tuple[int, int]):
+        """Resize the blur buffer."""
+        super().resize(size)
+        self._fbo.color_attachments[0].resize(size)
+        self._fbo.resize()
 
     def render(self, source: Texture2D) -> Texture2D:
         """Render"""
@@ -147,6 +187,12 @@ def __init__(self, size, kernel_size=5, sigma=2, multiplier=0, step=1):
             size, kernel_size=kernel_size, sigma=sigma, multiplier=multiplier, step=step
         )
 
+    def resize(self, size: tuple[int, int]):
+        """Resize the blur buffers."""
+        super().resize(size)
+        self._blur_x.resize(size)
+        self._blur_y.resize(size)
+
     def render(self, source: Texture2D) -> Texture2D:
         """Render"""
         blurred_x = self._blur_x.render(source)
@@ -205,7 +251,7 @@ def __init__(
             vertex_shader=":system:shaders/texture_default_projection_vs.glsl",
             fragment_shader=":system:shaders/postprocessing/gaussian_combine_fs.glsl",
         )
-        self._quad_fs = geometry.quad_2d_fs()
+        self._quad_fs = _fs_quad(self.ctx)
 
     def render(self, source, target):
         """Render"""
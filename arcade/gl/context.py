@@ -4,7 +4,7 @@
 import weakref
 from collections import deque
 from contextlib import contextmanager
-from ctypes import c_char_p, c_float, c_int, cast
+from ctypes import byref, c_char_p, c_float, c_int, cast
 from typing import (
     Any,
     Deque,
@@ -239,6 +239,24 @@ def __init__(
         # Texture unit we use when doing operations on textures to avoid
         # affecting currently bound textures in the first units
         self.default_texture_unit: int = self._info.MAX_TEXTURE_IMAGE_UNITS - 1
+        # The texture array bound to each texture unit. Used to skip redundant
+        # glBindTexture calls in TextureArray.use(). Only valid as long as every
+        # GL_TEXTURE_2D_ARRAY bind goes through TextureArray.
+        self._bound_textures: Dict[int, int] = {}
+        # Unpack alignments to restore when an upload batch ends
+        self._upload_alignment_stack: List[int] = []
+        # Pixel unpack buffers reused for streaming texture uploads
+        self._pbo_pool: List[Buffer] = []
+        # Scratch memory for reading back GL state and pixel data
+        self._scratch_i4 = (gl.GLint * 4)()
+        self._scratch_ub_cache: Dict[int, Any] = {}
+        # Deleted texture arrays kept alive for reuse, keyed by format and size.
+        # Each entry holds the byte size of one texture and the pooled names.
+        self._texture_pool: Dict[tuple, Tuple[int, List[int]]] = {}
+        # Pool key and byte size of each live texture array that can be recycled
+        self._texture_pool_keys: Dict[int, Tuple[tuple, int]] = {}
+        self._texture_pool_size = 0
+        self._texture_pool_max_size = 0
 
         # Detect the default framebuffer
         self._screen = DefaultFrameBuffer(self)
@@ -267,6 +285,20 @@ def __init__(
             have_ext = gl.gl_info.have_extension("GL_ARB_separate_shader_objects")
             self._ext_separate_shader_objects_enabled = self.gl_version >= (4, 1) or have_ext
 
+        # Detect support for direct state access (glTextureParameteri etc).
+        # Not supported in gles
+        self._ext_direct_state_access_enabled = False
+        if self.gl_api == "gl":
+            have_ext = gl.gl_info.have_extension("GL_ARB_direct_state_access")
+            self._ext_direct_state_access_enabled = self.gl_version >= (4, 5) or have_ext
+
+        # Detect support for glInvalidateTexImage and glInvalidateTexSubImage.
+        # Not supported in gles
+        self._ext_invalidate_subdata_enabled = False
+        if self.gl_api == "gl":
+            have_ext = gl.gl_info.have_extension("GL_ARB_invalidate_subdata")
+            self._ext_invalidate_subdata_enabled = self.gl_version >= (4, 3) or have_ext
+
         # We enable scissor testing by default.
         # This is always set to the same value as the viewport
         # to avoid background color affecting areas outside the viewport
@@ -816,6 +848,82 @@ def primitive_restart_index(self, value: int):
         if self.gl_api == "gl":
             gl.glPrimitiveRestartIndex(value)
 
+    @property
+    def texture_pool_max_size(self) -> int:
+        """
+        Get or set the maximum number of bytes of texture storage kept in the texture pool.
+
+        Pooling is disabled by default (``0``). When enabled, deleted texture arrays
+        are kept for new empty texture arrays of the same format and size. Reused
+        textures keep the contents of their previous owner, and a deleted texture
+        must not still be attached to a framebuffer.
+
+        Lowering the limit frees pooled textures until the pool fits.
+        """
+        return self._texture_pool_max_size
+
+    @texture_pool_max_size.setter
+    def texture_pool_max_size(self, value: int):
+        self._texture_pool_max_size = max(0, value)
+        self._trim_texture_pool(self._texture_pool_max_size)
+
+    def flush_texture_pool(self) -> None:
+        """Free all textures kept in the texture pool."""
+        self._trim_texture_pool(0)
+
+    def _trim_texture_pool(self, max_size: int) -> None:
+        """Delete pooled textures until the pool holds at most ``max_size`` bytes"""
+        for key in list(self._texture_pool):
+            if self._texture_pool_size <= max_size:
+                break
+
+            byte_size, names = self._texture_pool[key]
+            while names and self._texture_pool_size > max_size:
+                name = names.pop()
+                gl.glDeleteTextures(1, byref(gl.GLuint(name)))
+                self._texture_pool_size -= byte_size
+                # The name can be handed out again, so forget where it was bound
+                for unit, bound in list(self._bound_textures.items()):
+                    if bound == name:
+                        del self._bound_textures[unit]
+            if not names:
+                del self._texture_pool[key]
+
+    def begin_uploads(self, alignment: int = 1) -> None:
+        """
+        Start a batch of raw texture uploads.
+
+        The unpack alignment is set once for the whole batch so
+        :py:meth:`arcade.gl.TextureArray.write_raw` calls don't need to
+        touch pixel store state. Must be paired with :py:meth:`end_uploads`.
+
+        The unpack alignment is global state shared with pyglet and every
+        other texture upload. Don't draw text or write other textures
+        inside the batch, since they change it.
+
+        Example::
+
+            ctx.begin_uploads(alignment=1)
+            for layer, (pointer, size) in enumerate(layers):
+                texture.write_raw(pointer, size, viewport=(0, 0, layer, 64, 64))
+            ctx.end_uploads()
+
+        Args:
+            alignment: The unpack alignment in bytes. Possible values: 1, 2, 4, 8
+        """
+        # Other code changes the alignment without telling us, so ask OpenGL
+        value = c_int()
+        gl.glGetIntegerv(gl.GL_UNPACK_ALIGNMENT, value)
+        self._upload_alignment_stack.append(value.value)
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, alignment)
+
+    def end_uploads(self) -> None:
+        """End a batch of raw texture uploads and restore the previous unpack alignment."""
+        if not self._upload_alignment_stack:
+            raise RuntimeError("end_uploads() called without begin_uploads()")
+
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, self._upload_alignment_stack.pop())
+
     def finish(self) -> None:
         """
         Wait until all OpenGL rendering commands are completed.
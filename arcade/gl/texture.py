@@ -12,6 +12,7 @@
     BufferOrBufferProtocol,
     PyGLuint,
     compare_funcs,
+    image_access_modes,
     pixel_formats,
     swizzle_enum_to_str,
     swizzle_str_to_enum,
@@ -800,14 +801,8 @@ def bind_to_image(self, unit: int, read: bool = True, write: bool = True, level:
         if self._ctx.gl_api == "gles" and not self._immutable:
             raise ValueError("Textures bound to image units must be created with immutable=True")
 
-        access = gl.GL_READ_WRITE
-        if read and write:
-            access = gl.GL_READ_WRITE
-        elif read and not write:
-            access = gl.GL_READ_ONLY
-        elif not read and write:
-            access = gl.GL_WRITE_ONLY
-        else:
+        access = image_access_modes[(bool(read) << 1) | bool(write)]
+        if access is None:
             raise ValueError("Illegal access mode. The texture must at least be read or write only")
 
         gl.glBindImageTexture(unit, self._glo, level, 0, 0, access, self._internal_format)
@@ -856,6 +851,7 @@ def get_handle(self, resident: bool = True) -> int:
         return handle
 
     def __repr__(self) -> str:
-        return "<Texture glo={} size={}x{} components={}>".format(
-            self._glo.value, self._width, self._height, self._components
+        return (
+            f"<Texture glo={self._glo.value} size={self._width}x{self._height} "
+            f"components={self._components}>"
         )
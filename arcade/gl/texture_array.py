@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import weakref
-from ctypes import byref, string_at
-from typing import TYPE_CHECKING
+from ctypes import byref, memmove, string_at
+from typing import TYPE_CHECKING, Iterable, NoReturn
 
 from pyglet import gl
 
@@ -12,15 +11,34 @@
     BufferOrBufferProtocol,
     PyGLuint,
     compare_funcs,
+    image_access_modes,
     pixel_formats,
     swizzle_enum_to_str,
     swizzle_str_to_enum,
 )
-from .utils import data_to_ctypes
+from .utils import data_to_ctypes, data_to_pointer
 
 if TYPE_CHECKING:  # handle import cycle caused by type hinting
     from arcade.gl import Context
 
+# Uploads of at least this many bytes are streamed through a pixel buffer
+_PBO_UPLOAD_THRESHOLD = 64 * 1024
+# Total bytes of pixel buffers the context keeps for uploads. Larger uploads use client memory.
+_PBO_POOL_MAX_BYTES = 16 * 1024 * 1024
+# Total bytes of read buffers the context keeps for reuse. Larger reads always allocate.
+_SCRATCH_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Individual swizzle parameters for APIs without GL_TEXTURE_SWIZZLE_RGBA
+_swizzle_components = (
+    gl.GL_TEXTURE_SWIZZLE_R,
+    gl.GL_TEXTURE_SWIZZLE_G,
+    gl.GL_TEXTURE_SWIZZLE_B,
+    gl.GL_TEXTURE_SWIZZLE_A,
+)
+
+# Validated swizzle strings and their enums
+_SWIZZLE_CACHE: dict[str, tuple[int, int, int, int]] = {}
+
 
 class TextureArray:
     """
@@ -30,6 +48,10 @@ class TextureArray:
     A texture can also be created with different datatypes such as
     float, integer or unsigned integer.
 
+    If the context's texture pool is enabled, empty textures can take over
+    a deleted texture and keep its contents.
+    See :py:attr:`arcade.gl.Context.texture_pool_max_size`.
+
     The best way to create a texture instance is through :py:meth:`arcade.gl.Context.texture`
 
     Supported ``dtype`` values are::
@@ -87,6 +109,7 @@ class TextureArray:
     __slots__ = (
         "_ctx",
         "_glo",
+        "_glo_int",
         "_width",
         "_height",
         "_layers",
@@ -98,8 +121,14 @@ class TextureArray:
         "_compare_func",
         "_format",
         "_internal_format",
+        "_internal_format_int",
         "_type",
         "_component_size",
+        "_format_info",
+        "_bytes_per_pixel",
+        "_upload_fn",
+        "_bindless_handle",
+        "_bindless_resident",
         "_samples",
         "_filter",
         "_wrap_x",
@@ -130,12 +159,14 @@ def __init__(
         compressed: bool = False,
         compressed_data: bool = False,
     ):
-        self._glo = glo = gl.GLuint()
+        self._glo = gl.GLuint()
         self._ctx = ctx
         self._width, self._height, self._layers = size
         self._dtype = dtype
         self._components = components
         self._component_size = 0
+        self._format_info: tuple = ()
+        self._bytes_per_pixel = 0
         self._alignment = 1
         self._target = target
         self._samples = min(max(0, samples), self._ctx.info.MAX_SAMPLES)
@@ -146,6 +177,8 @@ def __init__(
         self._internal_format = internal_format
         self._compressed = compressed
         self._compressed_data = compressed_data
+        self._bindless_handle: int | None = None
+        self._bindless_resident = False
         # Default filters for float and integer textures
         # Integer textures should have NEAREST interpolation
         # by default 3.3 core doesn't really support it consistently.
@@ -168,32 +201,46 @@ def __init__(
             gl.GL_TEXTURE_2D_ARRAY if self._samples == 0 else gl.GL_TEXTURE_2D_MULTISAMPLE_ARRAY
         )
 
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glGenTextures(1, byref(self._glo))
+        self._resolve_format()
+        self._select_upload_fn()
 
-        if self._glo.value == 0:
-            raise RuntimeError("Cannot create Texture. OpenGL failed to generate a texture id")
+        # Empty textures can take over the name and storage of a deleted texture
+        recycled = data is None and self._acquire_pooled_glo()
+        if not recycled:
+            gl.glGenTextures(1, byref(self._glo))
 
-        gl.glBindTexture(self._target, self._glo)
+            if self._glo.value == 0:
+                raise RuntimeError("Cannot create Texture. OpenGL failed to generate a texture id")
 
-        self._texture_2d_array(data)
+        # Plain int copy of the name for hot paths. Avoids unwrapping the GLuint every call
+        self._glo_int = self._glo.value
+        # Count the texture once it has a name so a failed init is balanced in __del__
+        self.ctx.stats.incr("texture")
+        self._bind()
 
-        # Only set texture parameters on non-multisample textures
-        if self._samples == 0:
-            self.filter = filter or self._filter
-            self.wrap_x = wrap_x or self._wrap_x
-            self.wrap_y = wrap_y or self._wrap_y
+        if recycled:
+            if self._samples == 0:
+                self._reset_params()
+        else:
+            self._texture_2d_array(data)
 
-        if self._ctx.gc_mode == "auto":
-            weakref.finalize(self, TextureArray.delete_glo, self._ctx, glo)
+        self._register_pool_key()
 
-        self.ctx.stats.incr("texture")
+        # Only set texture parameters on non-multisample textures
+        if self._samples == 0:
+            self.configure(
+                filter=filter or self._filter,
+                wrap_x=wrap_x or self._wrap_x,
+                wrap_y=wrap_y or self._wrap_y,
+            )
 
     def resize(self, size: tuple[int, int]):
         """
         Resize the texture. This will re-allocate the internal
         memory and all pixel data will be lost.
 
+        Nothing happens if the size is unchanged.
+
         .. note:: Immutable textures cannot be resized.
 
         Args:
@@ -202,123 +249,169 @@ def resize(self, size: tuple[int, int]):
         if self._immutable:
             raise ValueError("Immutable textures cannot be resized")
 
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glBindTexture(self._target, self._glo)
+        if tuple(size) == (self._width, self._height):
+            return
+
+        self._bind()
+
+        # Let the driver know the old contents can be discarded
+        if self._ctx._ext_invalidate_subdata_enabled:
+            gl.glInvalidateTexImage(self._glo, 0)
 
         self._width, self._height = size
 
         self._texture_2d_array(None)
+        self._register_pool_key()
 
     def __del__(self):
-        # Intercept garbage collection if we are using Context.gc()
-        if self._ctx.gc_mode == "context_gc" and self._glo.value > 0:
-            self._ctx.objects.append(self)
-
-    def _texture_2d_array(self, data):
-        """Create a 2D texture"""
-        # Start by resolving the texture format
+        # __init__ may have failed before a texture was created
+        glo = getattr(self, "_glo", None)
+        if glo is not None and glo.value > 0:
+            # Intercept garbage collection if we are using Context.gc()
+            if self._ctx.gc_mode == "context_gc":
+                self._ctx.objects.append(self)
+            # Delete right away in auto mode. This is cheaper than a finalizer per texture.
+            elif self._ctx.gc_mode == "auto":
+                TextureArray.delete_glo(self._ctx, self._glo)
+
+    def _resolve_format(self) -> None:
+        """Resolve the texture format. This only needs to happen once."""
         try:
-            format_info = pixel_formats[self._dtype]
+            format_info = self._format_info = pixel_formats[self._dtype]
         except KeyError:
             raise ValueError(
                 f"dype '{self._dtype}' not support. Supported types are : "
                 f"{tuple(pixel_formats.keys())}"
             )
         _format, _internal_format, self._type, self._component_size = format_info
+        self._bytes_per_pixel = self._component_size * self._components
+        if not self._depth:
+            self._format = _format[self._components]
+            if self._internal_format is None:
+                self._internal_format = _internal_format[self._components]
+        self._internal_format_int = int(self._internal_format or 0)
+
+    def _texture_2d_array(self, data):
+        """Create a 2D texture"""
         if data is not None:
             byte_length, data = data_to_ctypes(data)
             self._validate_data_size(data, byte_length, self._width, self._height, self._layers)
 
-        # If we are dealing with a multisampled texture we have less options
-        if self._target == gl.GL_TEXTURE_2D_MULTISAMPLE_ARRAY:
-            gl.glTexImage3DMultisample(
-                self._target,
-                self._samples,
-                _internal_format[self._components],
-                self._width,
-                self._height,
-                self._layers,
-                True,  # Fixed sample locations
-            )
-            return
+        try:
+            self._upload_fn(self, data)
+        except gl.GLException as ex:
+            self._raise_texture_error(ex)
 
+    def _select_upload_fn(self) -> None:
+        """
+        Pick the function allocating storage for this kind of texture.
+
+        The plain function is stored rather than a bound method
+        to avoid a reference cycle.
+        """
+        if self._samples > 0:
+            self._upload_fn = TextureArray._upload_multisample
+        elif self._depth:
+            self._upload_fn = TextureArray._upload_depth
+        elif self._immutable:
+            self._upload_fn = TextureArray._upload_immutable
+        elif self._compressed_data is True:
+            self._upload_fn = TextureArray._upload_compressed
+        else:
+            self._upload_fn = TextureArray._upload_mutable
+
+    def _upload_multisample(self, data) -> None:
+        """Allocate multisampled storage. These textures can't have data."""
+        # Depth textures don't resolve an internal format. Use the color format.
+        internal_format = self._internal_format or self._format_info[1][self._components]
+        gl.glTexImage3DMultisample(
+            self._target,
+            self._samples,
+            internal_format,
+            self._width,
+            self._height,
+            self._layers,
+            True,  # Fixed sample locations
+        )
+
+    def _upload_depth(self, data) -> None:
+        """Allocate depth storage"""
         # Make sure we unpack the pixel data with correct alignment
         # or we'll end up with corrupted textures
         gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, self._alignment)
         gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, self._alignment)
+        gl.glTexImage3D(
+            self._target,
+            0,  # level
+            gl.GL_DEPTH_COMPONENT24,
+            self._width,
+            self._height,
+            self._layers,
+            0,
+            gl.GL_DEPTH_COMPONENT,
+            gl.GL_UNSIGNED_INT,  # gl.GL_FLOAT,
+            data,
+        )
+        self.compare_func = "<="
 
-        # Create depth 2d texture
-        if self._depth:
-            gl.glTexImage3D(
-                self._target,
-                0,  # level
-                gl.GL_DEPTH_COMPONENT24,
-                self._width,
-                self._height,
-                self._layers,
-                0,
-                gl.GL_DEPTH_COMPONENT,
-                gl.GL_UNSIGNED_INT,  # gl.GL_FLOAT,
-                data,
+    def _upload_immutable(self, data) -> None:
+        """Specify immutable storage. glTexStorage3D can only be called once."""
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, self._alignment)
+        gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, self._alignment)
+        gl.glTexStorage3D(
+            self._target,
+            1,  # Levels
+            self._internal_format,
+            self._width,
+            self._height,
+            self._layers,
+        )
+        if data:
+            self.write(data)
+
+    def _upload_compressed(self, data) -> None:
+        """Specify mutable storage with compressed data"""
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, self._alignment)
+        gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, self._alignment)
+        gl.glCompressedTexImage3D(
+            self._target,  # target
+            0,  # level
+            self._internal_format,  # internal_format
+            self._width,  # width
+            self._height,  # height
+            self._layers,  # layers
+            0,  # border
+            len(data),  # size
+            data,  # data
+        )
+
+    def _upload_mutable(self, data) -> None:
+        """Specify mutable storage. glTexImage3D can be called multiple times to re-allocate."""
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, self._alignment)
+        gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, self._alignment)
+        gl.glTexImage3D(
+            self._target,  # target
+            0,  # level
+            self._internal_format,  # internal_format
+            self._width,  # width
+            self._height,  # height
+            self._layers,  # layers
+            0,  # border
+            self._format,  # format
+            self._type,  # type
+            data,  # data
+        )
+
+    def _raise_texture_error(self, ex: gl.GLException) -> NoReturn:
+        """Raise a more descriptive error when texture storage can't be created"""
+        raise gl.GLException(
+            (
+                f"Unable to create texture: {ex} : dtype={self._dtype} "
+                f"size={self.size} components={self._components} "
+                f"MAX_TEXTURE_SIZE = {self.ctx.info.MAX_TEXTURE_SIZE}"
+                f": {ex}"
             )
-            self.compare_func = "<="
-        # Create normal 2d texture
-        else:
-            try:
-                self._format = _format[self._components]
-                if self._internal_format is None:
-                    self._internal_format = _internal_format[self._components]
-
-                if self._immutable:
-                    # Specify immutable storage for this texture.
-                    # glTexStorage2D can only be called once
-                    gl.glTexStorage3D(
-                        self._target,
-                        1,  # Levels
-                        self._internal_format,
-                        self._width,
-                        self._height,
-                        self._layers,
-                    )
-                    if data:
-                        self.write(data)
-                else:
-                    # glTexImage2D can be called multiple times to re-allocate storage
-                    # Specify mutable storage for this texture.
-                    if self._compressed_data is True:
-                        gl.glCompressedTexImage3D(
-                            self._target,  # target
-                            0,  # level
-                            self._internal_format,  # internal_format
-                            self._width,  # width
-                            self._height,  # height
-                            self._layers,  # layers
-                            0,  # border
-                            len(data),  # size
-                            data,  # data
-                        )
-                    else:
-                        gl.glTexImage3D(
-                            self._target,  # target
-                            0,  # level
-                            self._internal_format,  # internal_format
-                            self._width,  # width
-                            self._height,  # height
-                            self._layers,  # layers
-                            0,  # border
-                            self._format,  # format
-                            self._type,  # type
-                            data,  # data
-                        )
-            except gl.GLException as ex:
-                raise gl.GLException(
-                    (
-                        f"Unable to create texture: {ex} : dtype={self._dtype} "
-                        f"size={self.size} components={self._components} "
-                        f"MAX_TEXTURE_SIZE = {self.ctx.info.MAX_TEXTURE_SIZE}"
-                        f": {ex}"
-                    )
-                )
+        )
 
     @property
     def ctx(self) -> Context:
@@ -368,7 +461,7 @@ def samples(self) -> int:
     @property
     def byte_size(self) -> int:
         """The byte size of the texture."""
-        return pixel_formats[self._dtype][3] * self._components * self.width * self.height
+        return self._bytes_per_pixel * self._width * self._height
 
     @property
     def components(self) -> int:
@@ -417,49 +510,53 @@ def swizzle(self) -> str:
             # Reverse the components
             texture.swizzle = 'ABGR'
         """
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glBindTexture(self._target, self._glo)
-
-        # Read the current swizzle values from the texture
-        swizzle_r = gl.GLint()
-        swizzle_g = gl.GLint()
-        swizzle_b = gl.GLint()
-        swizzle_a = gl.GLint()
-
-        gl.glGetTexParameteriv(self._target, gl.GL_TEXTURE_SWIZZLE_R, swizzle_r)
-        gl.glGetTexParameteriv(self._target, gl.GL_TEXTURE_SWIZZLE_G, swizzle_g)
-        gl.glGetTexParameteriv(self._target, gl.GL_TEXTURE_SWIZZLE_B, swizzle_b)
-        gl.glGetTexParameteriv(self._target, gl.GL_TEXTURE_SWIZZLE_A, swizzle_a)
-
-        swizzle_str = ""
-        for v in [swizzle_r, swizzle_g, swizzle_b, swizzle_a]:
-            swizzle_str += swizzle_enum_to_str[v.value]
+        # Read all four swizzle values from the texture in one call.
+        # GLES has no GL_TEXTURE_SWIZZLE_RGBA so we query each component there.
+        swizzle = self._ctx._scratch_i4
+        if self._ctx._ext_direct_state_access_enabled:
+            gl.glGetTextureParameteriv(self._glo, gl.GL_TEXTURE_SWIZZLE_RGBA, swizzle)
+        elif self._ctx.gl_api == "gles":
+            self._bind()
+            for i, pname in enumerate(_swizzle_components):
+                gl.glGetTexParameteriv(self._target, pname, byref(swizzle, i * 4))
+        else:
+            self._bind()
+            gl.glGetTexParameteriv(self._target, gl.GL_TEXTURE_SWIZZLE_RGBA, swizzle)
 
-        return swizzle_str
+        return "".join(swizzle_enum_to_str[v] for v in swizzle)
 
     @swizzle.setter
     def swizzle(self, value: str):
         if not isinstance(value, str):
             raise ValueError(f"Swizzle must be a string, not '{type(str)}'")
 
-        if len(value) != 4:
-            raise ValueError("Swizzle must be a string of length 4")
+        value = value.upper()
+        swizzle_enums = _SWIZZLE_CACHE.get(value)
+        if swizzle_enums is None:
+            if len(value) != 4:
+                raise ValueError("Swizzle must be a string of length 4")
 
-        swizzle_enums = []
-        for c in value:
-            try:
-                c = c.upper()
-                swizzle_enums.append(swizzle_str_to_enum[c])
-            except KeyError:
-                raise ValueError(f"Swizzle value '{c}' invalid. Must be one of RGBA01")
+            enums = []
+            for c in value:
+                try:
+                    enums.append(swizzle_str_to_enum[c])
+                except KeyError:
+                    raise ValueError(f"Swizzle value '{c}' invalid. Must be one of RGBA01")
 
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glBindTexture(self._target, self._glo)
+            swizzle_enums = _SWIZZLE_CACHE[value] = (enums[0], enums[1], enums[2], enums[3])
 
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_SWIZZLE_R, swizzle_enums[0])
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_SWIZZLE_G, swizzle_enums[1])
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_SWIZZLE_B, swizzle_enums[2])
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_SWIZZLE_A, swizzle_enums[3])
+        if self._ctx._ext_direct_state_access_enabled:
+            gl.glTextureParameteriv(
+                self._glo, gl.GL_TEXTURE_SWIZZLE_RGBA, (gl.GLint * 4)(*swizzle_enums)
+            )
+        elif self._ctx.gl_api == "gles":
+            for pname, enum in zip(_swizzle_components, swizzle_enums):
+                self._set_param_i(pname, enum)
+        else:
+            self._bind()
+            gl.glTexParameteriv(
+                self._target, gl.GL_TEXTURE_SWIZZLE_RGBA, (gl.GLint * 4)(*swizzle_enums)
+            )
 
     @property
     def filter(self) -> tuple[int, int]:
@@ -498,10 +595,8 @@ def filter(self, value: tuple[int, int]):
             raise ValueError("Texture filter must be a 2 component tuple (min, mag)")
 
         self._filter = value
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glBindTexture(self._target, self._glo)
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_MIN_FILTER, self._filter[0])
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_MAG_FILTER, self._filter[1])
+        self._set_param_i(gl.GL_TEXTURE_MIN_FILTER, self._filter[0])
+        self._set_param_i(gl.GL_TEXTURE_MAG_FILTER, self._filter[1])
 
     @property
     def wrap_x(self) -> int:
@@ -528,9 +623,7 @@ def wrap_x(self) -> int:
     @wrap_x.setter
     def wrap_x(self, value: int):
         self._wrap_x = value
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glBindTexture(self._target, self._glo)
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_WRAP_S, value)
+        self._set_param_i(gl.GL_TEXTURE_WRAP_S, value)
 
     @property
     def wrap_y(self) -> int:
@@ -557,9 +650,7 @@ def wrap_y(self) -> int:
     @wrap_y.setter
     def wrap_y(self, value: int):
         self._wrap_y = value
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glBindTexture(self._target, self._glo)
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_WRAP_T, value)
+        self._set_param_i(gl.GL_TEXTURE_WRAP_T, value)
 
     @property
     def anisotropy(self) -> float:
@@ -569,9 +660,7 @@ def anisotropy(self) -> float:
     @anisotropy.setter
     def anisotropy(self, value):
         self._anisotropy = max(1.0, min(value, self._ctx.info.MAX_TEXTURE_MAX_ANISOTROPY))
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glBindTexture(self._target, self._glo)
-        gl.glTexParameterf(self._target, gl.GL_TEXTURE_MAX_ANISOTROPY, self._anisotropy)
+        self._set_param_f(gl.GL_TEXTURE_MAX_ANISOTROPY, self._anisotropy)
 
     @property
     def compare_func(self) -> str | None:
@@ -595,23 +684,65 @@ def compare_func(self, value: str | None):
         if not self._depth:
             raise ValueError("Depth comparison function can only be set on depth textures")
 
-        if not isinstance(value, str) and value is not None:
-            raise ValueError(f"value must be as string: {self._compare_funcs.keys()}")
-
-        func = compare_funcs.get(value, None)
-        if func is None:
+        # A single lookup validates the value. Unhashable values raise TypeError.
+        try:
+            func = compare_funcs[value]
+        except (KeyError, TypeError):
             raise ValueError(f"value must be as string: {compare_funcs.keys()}")
 
+        # Texture parameters are kept across re-allocation so there's nothing to do
+        if value == self._compare_func:
+            return
+
         self._compare_func = value
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glBindTexture(self._target, self._glo)
         if value is None:
-            gl.glTexParameteri(self._target, gl.GL_TEXTURE_COMPARE_MODE, gl.GL_NONE)
+            self._set_param_i(gl.GL_TEXTURE_COMPARE_MODE, gl.GL_NONE)
         else:
-            gl.glTexParameteri(
-                self._target, gl.GL_TEXTURE_COMPARE_MODE, gl.GL_COMPARE_REF_TO_TEXTURE
-            )
-            gl.glTexParameteri(self._target, gl.GL_TEXTURE_COMPARE_FUNC, func)
+            self._set_param_i(gl.GL_TEXTURE_COMPARE_MODE, gl.GL_COMPARE_REF_TO_TEXTURE)
+            self._set_param_i(gl.GL_TEXTURE_COMPARE_FUNC, func)
+
+    def configure(
+        self,
+        *,
+        filter: tuple[int, int] | None = None,
+        wrap_x: int | None = None,
+        wrap_y: int | None = None,
+        swizzle: str | None = None,
+        anisotropy: float | None = None,
+        compare_func: str | None = None,
+    ) -> None:
+        """
+        Set several texture parameters at once.
+
+        Parameters that are ``None`` are left unchanged, so a compare
+        function can't be disabled here. Use :py:attr:`compare_func` for that.
+
+        Args:
+            filter:
+                The ``(min, mag)`` filter. See :py:attr:`filter`
+            wrap_x:
+                Horizontal wrap mode. See :py:attr:`wrap_x`
+            wrap_y:
+                Vertical wrap mode. See :py:attr:`wrap_y`
+            swizzle:
+                The swizzle mask. See :py:attr:`swizzle`
+            anisotropy:
+                The anisotropy. See :py:attr:`anisotropy`
+            compare_func:
+                The depth compare function. See :py:attr:`compare_func`
+        """
+        if filter is not None:
+            self.filter = filter
+        if wrap_x is not None:
+            self.wrap_x = wrap_x
+        if wrap_y is not None:
+            self.wrap_y = wrap_y
+        if swizzle is not None:
+            self.swizzle = swizzle
+        if anisotropy is not None:
+            self.anisotropy = anisotropy
+        if compare_func is not None:
+            self.compare_func = compare_func
 
     def read(self, level: int = 0, alignment: int = 1) -> bytes:
         """
@@ -624,25 +755,82 @@ def read(self, level: int = 0, alignment: int = 1) -> bytes:
                 Alignment of the start of each row in memory in number of bytes.
                 Possible values: 1,2,4
         """
+        buffer = self._scratch_buffer(self._read_size())
+        self._read_pixels(buffer, len(buffer), level, alignment)
+        return string_at(buffer, len(buffer))
+
+    def _scratch_buffer(self, size: int):
+        """
+        Get a reusable buffer of the given size from the context.
+
+        The most recently used sizes are kept so repeated reads of the
+        same texture don't allocate new memory. The cache holds at most
+        ``_SCRATCH_CACHE_MAX_BYTES`` so large reads don't pin memory.
+        """
+        if size > _SCRATCH_CACHE_MAX_BYTES:
+            return (gl.GLubyte * size)()
+
+        cache = self._ctx._scratch_ub_cache
+        buffer = cache.pop(size, None)
+        if buffer is None:
+            buffer = (gl.GLubyte * size)()
+            # Keys are the buffer sizes. Evict the least recently used until it fits.
+            while cache and sum(cache) + size > _SCRATCH_CACHE_MAX_BYTES:
+                del cache[next(iter(cache))]
+        # Reinsert to mark the buffer as the most recently used
+        cache[size] = buffer
+        return buffer
+
+    def read_into(self, buffer: BufferProtocol, level: int = 0, alignment: int = 1) -> None:
+        """
+        Read the contents of the texture directly into a writable buffer.
+
+        This avoids the intermediate copies made by :py:meth:`read` and
+        allows the same buffer to be reused for every read.
+
+        Args:
+            buffer:
+                A writable, contiguous object supporting the buffer protocol
+                that is at least as large as the texture data.
+            level:
+                The texture level to read
+            alignment:
+                Alignment of the start of each row in memory in number of bytes.
+                Possible values: 1,2,4
+        """
+        m_view = memoryview(buffer)
+        if m_view.readonly:
+            raise ValueError("Cannot read texture data into a read-only buffer")
+
+        size = self._read_size()
+        if m_view.nbytes < size:
+            raise ValueError(f"Buffer size {m_view.nbytes} is smaller than the data size {size}")
+
+        # The returned view keeps the memory behind the pointer alive during the read
+        byte_size, pointer, _pointer_view = data_to_pointer(m_view)
+        self._read_pixels(pointer, byte_size, level, alignment)
+
+    def _read_size(self) -> int:
+        """The number of bytes needed to read the entire texture"""
+        return self._width * self._height * self._layers * self._bytes_per_pixel
+
+    def _read_pixels(self, pointer, byte_size: int, level: int, alignment: int) -> None:
+        """Read the texture into memory at the given pointer"""
         if self._samples > 0:
             raise ValueError("Multisampled textures cannot be read directly")
 
         if self._ctx.gl_api == "gl":
-            gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-            gl.glBindTexture(self._target, self._glo)
             gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, alignment)
-
-            buffer = (
-                gl.GLubyte
-                * (self.width * self.height * self.layers * self._component_size * self._components)
-            )()
-            gl.glGetTexImage(self._target, level, self._format, self._type, buffer)
-            return string_at(buffer, len(buffer))
+            if self._ctx._ext_direct_state_access_enabled:
+                gl.glGetTextureImage(self._glo, level, self._format, self._type, byte_size, pointer)
+            else:
+                self._bind()
+                gl.glGetTexImage(self._target, level, self._format, self._type, pointer)
         elif self._ctx.gl_api == "gles":
             # FIXME: Check if we can attach a layer to the framebuffer. See Texture2D.read()
             raise ValueError("Reading texture array data not supported in GLES yet")
         else:
-            raise ValueError("Unknown gl_api: '{self._ctx.gl_api}'")
+            raise ValueError(f"Unknown gl_api: '{self._ctx.gl_api}'")
 
     def write(self, data: BufferOrBufferProtocol, level: int = 0, viewport=None) -> None:
         """Write byte data into layers of the texture.
@@ -671,44 +859,145 @@ def write(self, data: BufferOrBufferProtocol, level: int = 0, viewport=None) ->
         if self._samples > 0:
             raise ValueError("Writing to multisampled textures not supported")
 
-        x, y, l, w, h = (
-            0,
-            0,
-            0,
-            self._width,
-            self._height,
-        )
-        if viewport:
-            # TODO: Add more options here. For now we support writing to a single layer
-            #       (width, hight, num_layers) is a suggestion from moderngl
-            # if len(viewport) == 3:
-            #     w, h, l = viewport
-            if len(viewport) == 5:
-                x, y, l, w, h = viewport
-            else:
-                raise ValueError("Viewport must be of length 5")
+        x, y, l, w, h = self._parse_viewport(viewport)
 
         if isinstance(data, Buffer):
             gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, data.glo)
-            gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-            gl.glBindTexture(self._target, self._glo)
             gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, 1)
             gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
-            gl.glTexSubImage3D(self._target, level, x, y, w, h, l, self._format, self._type, 0)
+            self._sub_image(level, x, y, l, w, h, 0)
             gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
         else:
-            byte_size, data = data_to_ctypes(data)
-            self._validate_data_size(data, byte_size, w, h, 1)  # Single layer
-            gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-            gl.glBindTexture(self._target, self._glo)
+            # Point GL directly at the source memory. The view keeps it alive.
+            byte_size, pointer, m_view = data_to_pointer(data)
+            self._validate_data_size(None, byte_size, w, h, 1)  # Single layer
             gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, 1)
             gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+            if not (
+                byte_size >= _PBO_UPLOAD_THRESHOLD
+                and self._write_through_pbo(pointer, byte_size, level, x, y, l, w, h)
+            ):
+                self._sub_image(level, x, y, l, w, h, pointer)
+            del m_view
+
+    def write_raw(self, pointer, byte_size: int, level: int = 0, viewport=None) -> None:
+        """
+        Write raw pixel data into a layer of the texture.
+
+        Unlike :py:meth:`write` this doesn't touch the pixel store state.
+        It's meant to be called between :py:meth:`arcade.gl.Context.begin_uploads`
+        and :py:meth:`arcade.gl.Context.end_uploads` so a batch of uploads only
+        sets the alignment once.
+
+        Args:
+            pointer:
+                A ctypes pointer or array with the pixel data
+            byte_size:
+                The size of the data in bytes
+            level:
+                The texture level to write
+            viewport (optional):
+                The area of the texture to write as a 5 component tuple
+                ``(x, y, layer, width, height)``. If not provided the
+                first layer is written to.
+        """
+        if self._samples > 0:
+            raise ValueError("Writing to multisampled textures not supported")
+
+        x, y, l, w, h = self._parse_viewport(viewport)
+        self._validate_data_size(None, byte_size, w, h, 1)  # Single layer
+        self._sub_image(level, x, y, l, w, h, pointer)
+
+    def _parse_viewport(self, viewport) -> tuple[int, int, int, int, int]:
+        """Get the ``(x, y, layer, width, height)`` area to write to"""
+        if not viewport:
+            return 0, 0, 0, self._width, self._height
+
+        # TODO: Add more options here. For now we support writing to a single layer
+        #       (width, hight, num_layers) is a suggestion from moderngl
+        # if len(viewport) == 3:
+        #     w, h, l = viewport
+        if len(viewport) != 5:
+            raise ValueError("Viewport must be of length 5")
+
+        x, y, l, w, h = viewport
+        return x, y, l, w, h
+
+    def _write_through_pbo(
+        self, pointer, byte_size: int, level: int, x: int, y: int, layer: int, w: int, h: int
+    ) -> bool:
+        """
+        Stream pixel data through a pooled pixel unpack buffer.
+
+        The data is copied into a mapped buffer so the driver can transfer it
+        to the texture asynchronously instead of consuming it from client memory.
+        Mapping with ``GL_MAP_INVALIDATE_BUFFER_BIT`` orphans the previous storage
+        so a buffer can be reused while an earlier transfer is still in flight.
+
+        The pool holds at most ``_PBO_POOL_MAX_BYTES``. Returns ``False`` if
+        nothing was written and the caller should upload from client memory.
+        """
+        if byte_size > _PBO_POOL_MAX_BYTES:
+            return False
+
+        pool = self._ctx._pbo_pool
+        pbo = next((buffer for buffer in pool if buffer.size >= byte_size), None)
+        if pbo is None:
+            # Round up so similar sizes can share a buffer, unless that doesn't fit
+            reserve = 1 << (byte_size - 1).bit_length()
+            if reserve > _PBO_POOL_MAX_BYTES:
+                reserve = byte_size
+            # Release the oldest buffers until the new one fits
+            while pool and sum(buffer.size for buffer in pool) + reserve > _PBO_POOL_MAX_BYTES:
+                del pool[0]
+            pbo = self._ctx.buffer(reserve=reserve, usage="stream")
+            pool.append(pbo)
+
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, pbo.glo)
+        mapped = gl.glMapBufferRange(
+            gl.GL_PIXEL_UNPACK_BUFFER,
+            0,
+            byte_size,
+            gl.GL_MAP_WRITE_BIT | gl.GL_MAP_INVALIDATE_BUFFER_BIT,
+        )
+        if not mapped:
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+            return False
+
+        memmove(mapped, pointer, byte_size)
+        # The contents can be lost while mapped (display mode change etc)
+        if not gl.glUnmapBuffer(gl.GL_PIXEL_UNPACK_BUFFER):
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+            return False
+
+        self._sub_image(level, x, y, layer, w, h, 0)
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+        return True
+
+    def _sub_image(self, level: int, x: int, y: int, layer: int, w: int, h: int, data) -> None:
+        """Write pixel data or an unpack buffer offset into a single layer"""
+        # The old contents of a fully overwritten layer can be discarded
+        if (
+            self._ctx._ext_invalidate_subdata_enabled
+            and x == 0
+            and y == 0
+            and w == self._width
+            and h == self._height
+        ):
+            gl.glInvalidateTexSubImage(self._glo, level, 0, 0, layer, w, h, 1)
+
+        if self._ctx._ext_direct_state_access_enabled:
+            gl.glTextureSubImage3D(
+                self._glo, level, x, y, layer, w, h, 1, self._format, self._type, data
+            )
+        else:
+            self._bind()
             gl.glTexSubImage3D(
                 self._target,  # target
                 level,  # level
                 x,  # x offset
                 y,  # y offset
-                l,  # layer
+                layer,  # layer
                 w,  # width
                 h,  # height
                 1,  # depth (one layer)
@@ -727,12 +1016,10 @@ def _validate_data_size(
         if self._compressed is True:
             return
 
-        expected_size = width * height * layers * self._component_size * self._components
+        expected_size = self._bytes_per_pixel * width * height * layers
         if byte_size != expected_size:
-            raise ValueError(
-                f"Data size {len(byte_data)} does not match expected size {expected_size}"
-            )
-        if len(byte_data) != byte_size:
+            raise ValueError(f"Data size {byte_size} does not match expected size {expected_size}")
+        if byte_data is not None and len(byte_data) != byte_size:
             raise ValueError(
                 f"Data size {len(byte_data)} does not match reported size {expected_size}"
             )
@@ -768,20 +1055,105 @@ def build_mipmaps(self, base: int = 0, max_level: int = 1000) -> None:
         if self._samples > 0:
             raise ValueError("Multisampled textures don't support mimpmaps")
 
-        gl.glActiveTexture(gl.GL_TEXTURE0 + self._ctx.default_texture_unit)
-        gl.glBindTexture(self._target, self._glo)
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_BASE_LEVEL, base)
-        gl.glTexParameteri(self._target, gl.GL_TEXTURE_MAX_LEVEL, max_level)
-        gl.glGenerateMipmap(self._target)
+        self._set_param_i(gl.GL_TEXTURE_BASE_LEVEL, base)
+        self._set_param_i(gl.GL_TEXTURE_MAX_LEVEL, max_level)
+        if self._ctx._ext_direct_state_access_enabled:
+            gl.glGenerateTextureMipmap(self._glo)
+        else:
+            gl.glGenerateMipmap(self._target)
+
+    def _set_param_i(self, pname: int, value: int) -> None:
+        """Set an integer texture parameter, using direct state access if available"""
+        if self._ctx._ext_direct_state_access_enabled:
+            gl.glTextureParameteri(self._glo, pname, value)
+        else:
+            self._bind()
+            gl.glTexParameteri(self._target, pname, value)
+
+    def _set_param_f(self, pname: int, value: float) -> None:
+        """Set a float texture parameter, using direct state access if available"""
+        if self._ctx._ext_direct_state_access_enabled:
+            gl.glTextureParameterf(self._glo, pname, value)
+        else:
+            self._bind()
+            gl.glTexParameterf(self._target, pname, value)
+
+    def _pool_key(self) -> tuple | None:
+        """The key for recycling this texture's name and storage, if it can be recycled"""
+        if self._depth or self._compressed:
+            return None
+        return (
+            self._internal_format,
+            self._width,
+            self._height,
+            self._layers,
+            self._samples,
+            self._immutable,
+        )
+
+    def _pool_byte_size(self) -> int:
+        """The approximate number of bytes of storage held by this texture"""
+        size = self._width * self._height * self._layers * self._bytes_per_pixel
+        return size * max(1, self._samples)
+
+    def _register_pool_key(self) -> None:
+        """Tell the context how to recycle this texture when it's deleted"""
+        key = self._pool_key()
+        if key is not None:
+            self._ctx._texture_pool_keys[self._glo.value] = key, self._pool_byte_size()
+
+    def _acquire_pooled_glo(self) -> bool:
+        """Take over a deleted texture with the same format and size if one exists"""
+        ctx = self._ctx
+        # The pool may still hold textures after it was disabled. Don't hand them out.
+        if ctx.texture_pool_max_size <= 0:
+            return False
+
+        key = self._pool_key()
+        entry = ctx._texture_pool.get(key) if key is not None else None
+        if not entry or not entry[1]:
+            return False
+
+        byte_size, names = entry
+        self._glo.value = names.pop()
+        ctx._texture_pool_size -= byte_size
+        return True
+
+    def _reset_params(self) -> None:
+        """Reset parameters a recycled texture may have inherited from its previous owner"""
+        self.swizzle = "RGBA"
+        if self._ctx.info.MAX_TEXTURE_MAX_ANISOTROPY > 1.0:
+            self.anisotropy = 1.0
+        self._set_param_i(gl.GL_TEXTURE_BASE_LEVEL, 0)
+        self._set_param_i(gl.GL_TEXTURE_MAX_LEVEL, 1000)
+
+    @staticmethod
+    def _recycle_glo(ctx: Context, glo: gl.GLuint) -> bool:
+        """Move a texture into the context's texture pool instead of deleting it"""
+        entry = ctx._texture_pool_keys.pop(glo.value, None)
+        if entry is None:
+            return False
+
+        key, byte_size = entry
+        if ctx._texture_pool_size + byte_size > ctx.texture_pool_max_size:
+            return False
+
+        ctx._texture_pool.setdefault(key, (byte_size, []))[1].append(glo.value)
+        ctx._texture_pool_size += byte_size
+        return True
 
     def delete(self):
         """
         Destroy the underlying OpenGL resource.
 
+        If the context's texture pool is enabled and has room, the texture
+        is kept for reuse instead of being freed.
+
         Don't use this unless you know exactly what you are doing.
         """
         self.delete_glo(self._ctx, self._glo)
         self._glo.value = 0
+        self._glo_int = 0
 
     @staticmethod
     def delete_glo(ctx: "Context", glo: gl.GLuint):
@@ -798,19 +1170,46 @@ def delete_glo(ctx: "Context", glo: gl.GLuint):
         if gl.current_context is None:
             return
 
-        if glo.value != 0:
+        if glo.value != 0 and not TextureArray._recycle_glo(ctx, glo):
             gl.glDeleteTextures(1, byref(glo))
+            # Deleted textures are unbound from all units and the name can be reused
+            for unit, bound in list(ctx._bound_textures.items()):
+                if bound == glo.value:
+                    del ctx._bound_textures[unit]
 
         ctx.stats.decr("texture")
 
     def use(self, unit: int = 0) -> None:
         """Bind the texture to a channel,
 
+        The context remembers the texture array bound to each unit and skips
+        binding it again. This only holds if every ``GL_TEXTURE_2D_ARRAY`` bind
+        goes through :py:class:`TextureArray`, which is the case within arcade.
+        If your own OpenGL code binds texture arrays, call
+        :py:meth:`arcade.ArcadeContext.reset` afterwards.
+
         Args:
             unit: The texture unit to bind the texture.
         """
+        ctx = self._ctx
+        gl.glActiveTexture(gl.GL_TEXTURE0 + unit)
+        glo = self._glo_int
+        if ctx._bound_textures.get(unit) != glo:
+            gl.glBindTexture(self._target, glo)
+            ctx._bound_textures[unit] = glo
+
+    def _bind(self) -> None:
+        """
+        Bind the texture to the context's default texture unit.
+
+        Used before changing or reading the texture. This always binds since
+        skipping a bind based on stale tracking would change another texture.
+        """
+        ctx = self._ctx
+        unit = ctx.default_texture_unit
         gl.glActiveTexture(gl.GL_TEXTURE0 + unit)
-        gl.glBindTexture(self._target, self._glo)
+        gl.glBindTexture(self._target, self._glo_int)
+        ctx._bound_textures[unit] = self._glo_int
 
     def bind_to_image(self, unit: int, read: bool = True, write: bool = True, level: int = 0):
         """
@@ -828,17 +1227,11 @@ def bind_to_image(self, unit: int, read: bool = True, write: bool = True, level:
         if self._ctx.gl_api == "gles" and not self._immutable:
             raise ValueError("Textures bound to image units must be created with immutable=True")
 
-        access = gl.GL_READ_WRITE
-        if read and write:
-            access = gl.GL_READ_WRITE
-        elif read and not write:
-            access = gl.GL_READ_ONLY
-        elif not read and write:
-            access = gl.GL_WRITE_ONLY
-        else:
+        access = image_access_modes[(bool(read) << 1) | bool(write)]
+        if access is None:
             raise ValueError("Illegal access mode. The texture must at least be read or write only")
 
-        gl.glBindImageTexture(unit, self._glo, level, 0, 0, access, self._internal_format)
+        gl.glBindImageTexture(unit, self._glo_int, level, 0, 0, access, self._internal_format_int)
 
     def get_handle(self, resident: bool = True) -> int:
         """
@@ -870,20 +1263,54 @@ def get_handle(self, resident: bool = True) -> int:
         Args:
             resident: Make the texture resident.
         """
-        handle = gl.glGetTextureHandleARB(self._glo)
-        is_resident = gl.glIsTextureHandleResidentARB(handle)
-
-        # Ensure we don't try to make a resident texture resident again
-        if resident:
-            if not is_resident:
+        # The handle never changes so we only need to fetch it once
+        handle = self._bindless_handle
+        if handle is None:
+            handle = self._bindless_handle = gl.glGetTextureHandleARB(self._glo_int)
+            # Parameters are frozen once a handle exists so the texture can't be recycled
+            self._ctx._texture_pool_keys.pop(self._glo_int, None)
+
+        # Residency is only changed through this method so we can track it ourselves.
+        # Ensure we don't try to make a resident texture resident again.
+        if resident != self._bindless_resident:
+            if resident:
                 gl.glMakeTextureHandleResidentARB(handle)
-        else:
-            if is_resident:
+            else:
                 gl.glMakeTextureHandleNonResidentARB(handle)
+            self._bindless_resident = resident
 
         return handle
 
+    @classmethod
+    def make_resident_batch(cls, textures: Iterable[TextureArray], resident: bool = True) -> None:
+        """
+        Move the bindless handles of many textures in or out of residency.
+
+        Handles are created when needed. Textures already in the requested
+        state are skipped without any GL calls. See :py:meth:`get_handle`.
+
+        Args:
+            textures: The textures to change
+            resident: Make the textures resident or non-resident
+        """
+        make_resident = (
+            gl.glMakeTextureHandleResidentARB if resident else gl.glMakeTextureHandleNonResidentARB
+        )
+        for texture in textures:
+            if texture._bindless_resident == resident:
+                continue
+
+            handle = texture._bindless_handle
+            if handle is None:
+                # Creating the handle goes through get_handle to keep the texture out of the pool
+                handle = texture.get_handle(resident=False)
+
+            make_resident(handle)
+            texture._bindless_resident = resident
+
     def __repr__(self) -> str:
-        return "<TextureArray glo={} size={}x{}x{} components={}>".format(
-            self._glo.value, self._width, self._layers, self._height, self._components
+        return (
+            f"<TextureArray glo={self._glo.value} "
+            f"size={self._width}x{self._height}x{self._layers} "
+            f"components={self._components}>"
         )
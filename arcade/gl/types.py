@@ -36,6 +36,9 @@
     "1": gl.GL_ALWAYS,
 }
 
+# Image access modes indexed by (read << 1) | write
+image_access_modes = (None, gl.GL_WRITE_ONLY, gl.GL_READ_ONLY, gl.GL_READ_WRITE)
+
 # Swizzle conversion lookup
 swizzle_enum_to_str = {
     gl.GL_RED: "R",
@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from array import array
-from ctypes import c_byte
+from ctypes import c_byte, c_void_p
 from typing import Any
 
 
@@ -35,3 +35,47 @@ def data_to_ctypes(data: Any) -> tuple[int, Any]:
             return m_view.nbytes, c_bytes.from_buffer(m_view)
         except Exception as ex:
             raise TypeError(f"Failed to convert data to ctypes: {ex}")
+
+
+def data_to_pointer(data: Any) -> tuple[int, Any, memoryview | None]:
+    """
+    Get a pointer to the memory of an object supporting the buffer protocol
+    without copying the data.
+
+    - bytes will be returned as is
+    - Tuples will be converted to array
+    - Objects exposing ``__array_interface__`` (numpy etc) are referenced by
+      their data pointer. This also works for read-only arrays.
+    - Other types are wrapped in a ctypes array of bytes sharing their memory
+
+    The returned memoryview must be kept alive until the pointer is no longer used.
+
+    Args:
+        data: The data to get a pointer to.
+    Returns:
+        A tuple containing the size of the data in bytes, the data
+        or a pointer to it, and the memoryview backing the pointer.
+    """
+    if isinstance(data, bytes):
+        return len(data), data, None
+
+    if isinstance(data, tuple):
+        data = array("f", data)
+    try:
+        m_view = memoryview(data)
+    except Exception as ex:
+        raise TypeError(f"Failed to convert data to ctypes: {ex}")
+
+    if not m_view.c_contiguous:
+        raise ValueError("Data must be C contiguous")
+
+    # The view must cover the object itself, not a slice of it
+    interface = getattr(data, "__array_interface__", None)
+    if interface is not None and m_view.obj is data:
+        return m_view.nbytes, c_void_p(interface["data"][0]), m_view
+
+    try:
+        return m_view.nbytes, (c_byte * m_view.nbytes).from_buffer(m_view), m_view
+    except TypeError:
+        # Read-only buffers cannot be shared with ctypes
+        return m_view.nbytes, bytes(m_view), m_view
@@ -1,23 +1,26 @@
 #version 330
 
-#define KERNEL_SIZE 11
-#define MY_KERNEL (0.03582200398765452, 0.058789717526710104, 0.0864248760489264, 0.11380609461934069, 0.13423950363098489, 0.14183560837276687, 0.13423950363098489, 0.11380609461934069, 0.0864248760489264, 0.058789717526710104, 0.03582200398765452)
+// Number of linear sampled taps on each side including the center
+#define TAP_COUNT 4
 
 uniform sampler2D texture0;
 uniform vec2 target_size;
+// Merged kernel weights and texel offsets. Index 0 is the center tap.
+uniform float weights[TAP_COUNT];
+uniform float offsets[TAP_COUNT];
 
 in vec2 v_uv;
 out vec4 outColor;
 
-// https://observablehq.com/@jobleonard/gaussian-kernel-calculater
-const int KERNEL_RANGE = (KERNEL_SIZE - 1) / 2;
-const float KERNEL[KERNEL_SIZE] = float[KERNEL_SIZE]MY_KERNEL;
-
+// https://www.rastergrid.com/blog/2010/09/efficient-gaussian-blur-with-linear-sampling/
 void main() {
-    vec4 col = vec4(0.0);
     vec2 uv_step = vec2(1.0) / target_size;
-    for (int i = 0; i < KERNEL_SIZE; i++) {
-        col += texture(texture0, v_uv + vec2(0.0, uv_step.y * float(i - KERNEL_RANGE))) * KERNEL[i];
+    vec2 dir = vec2(0.0, uv_step.y);
+    vec4 col = texture(texture0, v_uv) * weights[0];
+    for (int i = 1; i < TAP_COUNT; i++) {
+        vec2 offset = dir * offsets[i];
+        col += texture(texture0, v_uv + offset) * weights[i];
+        col += texture(texture0, v_uv - offset) * weights[i];
     }
     outColor = vec4(col.rgb, 1.0);
 }
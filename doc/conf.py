@@ -7,6 +7,8 @@
 from textwrap import dedent
 from typing import Any, NamedTuple
 import docutils.nodes
+import importlib.util
+import json
 import os
 import re
 import runpy
@@ -47,7 +49,11 @@
 # Don't change to
 # from arcade.version import VERSION
 # or read the docs build will fail.
-from version import VERSION # pyright: ignore [reportMissingImports]
+# Load version.py by path instead so finding it doesn't walk sys.path.
+_version_spec = importlib.util.spec_from_file_location("arcade_version", ARCADE_MODULE / "version.py")
+_version_module = importlib.util.module_from_spec(_version_spec)
+_version_spec.loader.exec_module(_version_module)
+VERSION = _version_module.VERSION
 log.info(f"Got version {VERSION!r}")
 
 REPO_URL_BASE="https://github.com/pythonarcade/arcade"
@@ -88,12 +94,85 @@ def run_util(filename, run_name="__main__", init_globals=None):
 
     runpy.run_path(full_str, **kwargs)
 
-# Make thumbnails for the example code screenshots
-run_util("generate_example_thumbnails.py")
-# Create a tabular representation of the resources with embeds
-run_util("create_resources_listing.py", init_globals=RESOURCE_GLOBALS)
-# Run the generate quick API index script
-run_util('../util/update_quick_index.py')
+
+class PregenTask(NamedTuple):
+    script: str
+    inputs: tuple[Path, ...]
+    outputs: tuple[Path, ...]
+    init_globals: dict[str, Any] | None = None
+
+
+# Generation scripts with the files they read and write. Each script only
+# runs when one of its inputs changed since the last build or an output is
+# missing. The script itself is always an input.
+PREGEN_TASKS = (
+    # Make thumbnails for the example code screenshots
+    PregenTask(
+        "generate_example_thumbnails.py",
+        inputs=(HERE.parent / "example_code" / "images",),
+        outputs=(HERE.parent / "example_code" / "images" / "thumbs",),
+    ),
+    # Create a tabular representation of the resources with embeds
+    PregenTask(
+        "create_resources_listing.py",
+        inputs=(ARCADE_MODULE / "resources",),
+        outputs=(HERE.parent / "api_docs" / "resources.rst",),
+        init_globals=RESOURCE_GLOBALS,
+    ),
+    # Run the generate quick API index script
+    PregenTask(
+        "update_quick_index.py",
+        inputs=(ARCADE_MODULE, UTIL_DIR / "template_quick_index.rst", UTIL_DIR / "doc_helpers"),
+        outputs=(HERE.parent / "api_docs" / "quick_index.rst", HERE.parent / "api_docs" / "api"),
+    ),
+)
+PREGEN_STAMP_FILE = HERE.parent / ".pregen_stamp"
+
+
+def newest_mtime(paths) -> float:
+    """Get the newest modification time of the given files and directories"""
+    newest = 0.0
+    for path in paths:
+        if path.is_file():
+            newest = max(newest, path.stat().st_mtime)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            for name in files:
+                newest = max(newest, os.path.getmtime(os.path.join(root, name)))
+    return newest
+
+
+def run_pregen(app, _config):
+    """
+    Callback for the config-inited event.
+    Runs the generation scripts whose inputs changed since the last build.
+    """
+    try:
+        stamps = json.loads(PREGEN_STAMP_FILE.read_text())
+    except (OSError, ValueError):
+        stamps = {}
+
+    # The scripts expect to run from the doc directory
+    prev_cwd = os.getcwd()
+    os.chdir(app.confdir)
+    try:
+        for task in PREGEN_TASKS:
+            inputs = (UTIL_DIR / task.script, *task.inputs)
+            # The globals end up in the generated files, so changes to them count too
+            stamp = [newest_mtime(inputs), repr(task.init_globals)]
+            outputs_exist = all(path.exists() for path in task.outputs)
+            if outputs_exist and stamps.get(task.script) == stamp:
+                log.info(f"Skipping {task.script!r}: inputs unchanged")
+                continue
+
+            run_util(task.script, init_globals=task.init_globals)
+            # Generation can touch files that are also inputs
+            stamps[task.script] = [newest_mtime(inputs), repr(task.init_globals)]
+    finally:
+        os.chdir(prev_cwd)
+
+    PREGEN_STAMP_FILE.write_text(json.dumps(stamps, indent=4))
 
 
 autodoc_inherit_docstrings = False
@@ -293,63 +372,66 @@ def inspect_docstring_for_member(
     #     f"options={_options}\n"
     #     f"lines){lines}\n"
     # )
-    if len(lines) == 0:
-        print(f"{what} {name} is undocumented")
+    if not lines:
+        log.warning("%s %s is undocumented", what, name)
+
+    # Most members are documented non-classes. Nothing more to check for those.
+    if what != "class":
+        return
 
     # Docstring on __init__ in classes raise an error.
     # Class docstrings should cover the initializer.
-    if what == "class":
-        doc = _obj.__init__.__doc__
-        if doc and isinstance(doc, str) and not doc.startswith("Initialize self"):
-            raise ValueError((
-                f"Class {name} has a docstring on __init__. "
-                "The class docstring should cover docs for the initializer:\n {_obj.__init__.__doc__}"
-            ))
+    doc = _obj.__init__.__doc__
+    if doc and isinstance(doc, str) and not doc.startswith("Initialize self"):
+        raise ValueError((
+            f"Class {name} has a docstring on __init__. "
+            "The class docstring should cover docs for the initializer:\n {_obj.__init__.__doc__}"
+        ))
+
+
+# Will match a line starting with:
+#    name    '(?P<name>[a-z_A-Z]*)' followed by
+#    a Color '(?: *= *Color *\( *)' followed by
+#    red     '(?P<red>\d*)' followed by
+#    green   '(?P<green>\d*)' followed by
+#    blue    '(?P<blue>\d*)' followed by
+#    alpha   '(?P<alpha>\d*)'
+COLOR_MATCH = re.compile(r'^(?P<name>[a-z_A-Z]*)(?:[ =]*Color[ (]*)(?P<red>\d*)[ ,]*(?P<green>\d*)[ ,]*(?P<blue>\d*)[ ,]*(?P<alpha>\d*)', re.MULTILINE)
 
 
 def generate_color_table(filename, source):
     """
     This function Generates the Color tables in the docs for color and csscolor packages.
     """
-    append_text = "\n\n.. raw:: html\n\n"
-    append_text += "    <table class='colorTable'><tbody>\n"
-
-    # Will match a line containing:
-    #    name    '(?P<name>[a-z_A-Z]*)' followed by
-    #    a Color '(?: *= *Color *\( *)' followed by
-    #    red     '(?P<red>\d*)' followed by
-    #    green   '(?P<green>\d*)' followed by
-    #    blue    '(?P<blue>\d*)' followed by
-    #    alpha   '(?P<alpha>\d*)'
-    color_match = re.compile(r'(?P<name>[a-z_A-Z]*)(?:[ =]*Color[ (]*)(?P<red>\d*)[ ,]*(?P<green>\d*)[ ,]*(?P<blue>\d*)[ ,]*(?P<alpha>\d*)')
+    parts = [
+        "\n\n.. raw:: html\n\n",
+        "    <table class='colorTable'><tbody>\n",
+    ]
 
     with open(filename) as color_file:
-        for line in color_file:
-            # Check if the line has a Color.
-            matches = color_match.match(line)
-            if not matches:
-                continue
+        text = color_file.read()
 
-            name, r, g, b, a = matches.groupdict().values()
-            color_rgb_comma_sep= f"{r}, {g}, {b}"
+    # Find all lines with a Color in one pass
+    for name, r, g, b, a in COLOR_MATCH.findall(text):
+        color_rgb_comma_sep= f"{r}, {g}, {b}"
 
-            # Generate the alpha for CSS color function
-            rgba_css = f"rgba({color_rgb_comma_sep}, {int(a) / 255!s:.4})"
+        # Generate the alpha for CSS color function
+        rgba_css = f"rgba({color_rgb_comma_sep}, {int(a) / 255!s:.4})"
 
-            append_text += "    <tr>"
-            append_text += (
-                f"<td>"
-                f"<code class=\"docutils literal notranslate\">"
-                f"<span class=\"pre\">{name}</span>"
-                f"</code>"
-                f"</td>"
-            )
-            append_text += f"<td class=\"color-swatch\"><div style=\"background: {rgba_css};\">&nbsp</div></td>"
-            append_text += f"<td>({color_rgb_comma_sep}, {a})</td>"
-            append_text += "</tr>\n"
+        parts.append(
+            f"    <tr>"
+            f"<td>"
+            f"<code class=\"docutils literal notranslate\">"
+            f"<span class=\"pre\">{name}</span>"
+            f"</code>"
+            f"</td>"
+            f"<td class=\"color-swatch\"><div style=\"background: {rgba_css};\">&nbsp</div></td>"
+            f"<td>({color_rgb_comma_sep}, {a})</td>"
+            f"</tr>\n"
+        )
 
-    append_text += "    </tbody></table>"
-    source[0] += append_text
+    parts.append("    </tbody></table>")
+    source[0] += "".join(parts)
 
 
 @cache
@@ -366,23 +448,28 @@ def get_module_root(doc_confdir):  # pending: revert #2304 or figure out a bette
     return doc_confdir.parent / "arcade"
 
 
+# Documents getting a color table and the module (relative to arcade) it's generated from
+COLOR_TABLE_SOURCES = {
+    "api_docs/arcade.color": "color/__init__.py",
+    "api_docs/arcade.csscolor": "csscolor/__init__.py",
+    "api_docs/arcade.uicolor": "uicolor.py",
+}
+
+
 def source_read_handler(_app, doc_name: str, source):
     """
     Event handler for source-read event.
     Where we can modify the source of a document before it is parsed.
     """
-    def _get_dir(app, path):
-        path = get_module_root(_app.confdir) / path
-        print(f"Generated corrected module path: {path!r}")
-        return path
+    # Most documents don't need changes. A single lookup rules them out.
+    color_source = COLOR_TABLE_SOURCES.get(doc_name)
+    if color_source is None:
+        return
 
     # Inject the color tables into the source
-    if doc_name == "api_docs/arcade.color":
-        generate_color_table(_get_dir(_app, "color/__init__.py"), source)
-    elif doc_name == "api_docs/arcade.csscolor":
-        generate_color_table(_get_dir(_app, "csscolor/__init__.py"), source)
-    elif doc_name == "api_docs/arcade.uicolor":
-        generate_color_table(_get_dir(_app, "uicolor.py"), source)
+    path = get_module_root(_app.confdir) / color_source
+    print(f"Generated corrected module path: {path!r}")
+    generate_color_table(path, source)
 
 def on_autodoc_process_bases(app, name, obj, options, bases):
     """We don't care about the `object` base class, so remove it from the list of bases."""
@@ -420,6 +507,7 @@ def setup(app):
     # IMPORTANT: We can't use app.add_autodocumenter!
     # See the docstring of ClassDocumenter above for why.
     # sphinx.ext.autodoc.ClassDocumenter = ClassDocumenter
+    app.connect('config-inited', run_pregen)
     app.connect('source-read', source_read_handler)
     app.connect("autodoc-process-docstring", inspect_docstring_for_member)
     app.connect('autodoc-process-signature', strip_init_return_typehint, -1000)
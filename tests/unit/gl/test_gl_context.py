@@ -1,7 +1,10 @@
 """
 Low level tests for OpenGL 3.3 wrappers.
 """
+from ctypes import c_int
+
 import pytest
+from pyglet import gl
 from pyglet.math import Mat4
 
 
@@ -105,6 +108,31 @@ def test_enabled_only(ctx):
     assert not ctx.is_enabled(ctx.DEPTH_TEST)
 
 
+def _unpack_alignment() -> int:
+    value = c_int()
+    gl.glGetIntegerv(gl.GL_UNPACK_ALIGNMENT, value)
+    return value.value
+
+
+def test_begin_end_uploads(ctx):
+    """Nested upload batches restore the previous unpack alignment"""
+    gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 4)
+
+    ctx.begin_uploads(alignment=1)
+    assert _unpack_alignment() == 1
+    ctx.begin_uploads(alignment=8)
+    assert _unpack_alignment() == 8
+
+    ctx.end_uploads()
+    assert _unpack_alignment() == 1
+    ctx.end_uploads()
+    assert _unpack_alignment() == 4
+    assert ctx._upload_alignment_stack == []
+
+    with pytest.raises(RuntimeError):
+        ctx.end_uploads()
+
+
 def test_load_texture(ctx):
     # Default flipped and read value of corner pixel
     texture = ctx.load_texture(":resources:images/test_textures/test_texture.png", build_mipmaps=True)
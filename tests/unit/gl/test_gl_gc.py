@@ -1,4 +1,7 @@
 import gc
+
+import pytest
+
 import arcade
 from arcade.gl import geometry
 
@@ -72,6 +75,37 @@ def test_auto_gc(ctx):
     create_resources(ctx)
 
 
+def test_auto_gc_texture_array(ctx):
+    """Texture arrays are freed exactly once in auto mode, even if creation failed"""
+    gc.collect()
+    ctx.gc()
+    ctx.gc_mode = "auto"
+
+    created, freed = ctx.stats.texture
+    texture_array = ctx.texture_array((10, 10, 2))
+    del texture_array
+    assert ctx.stats.texture == (created + 1, freed + 1)
+
+    # Explicitly deleted before collection
+    texture_array = ctx.texture_array((10, 10, 2))
+    texture_array.delete()
+    del texture_array
+    gc.collect()
+    assert ctx.stats.texture == (created + 2, freed + 2)
+
+    # Creation fails before a texture exists
+    with pytest.raises(ValueError):
+        ctx.texture_array((10, 10, 2), components=5)
+    gc.collect()
+    assert ctx.stats.texture == (created + 2, freed + 2)
+
+    # Creation fails after the texture was created
+    with pytest.raises(ValueError):
+        ctx.texture_array((10, 10, 2), data=b"1234")
+    gc.collect()
+    assert ctx.stats.texture == (created + 3, freed + 3)
+
+
 def create_resources(ctx: arcade.ArcadeContext):
     # Texture
     created, freed = ctx.stats.texture
@@ -84,6 +118,17 @@ def create_resources(ctx: arcade.ArcadeContext):
         assert collected == 1
     assert ctx.stats.texture == (created + 1, freed + 1)
 
+    # Texture array
+    created, freed = ctx.stats.texture
+    texture_array = ctx.texture_array((10, 10, 2))
+    assert ctx.stats.texture == (created + 1, freed)
+    texture_array = None
+    gc.collect()
+    if ctx.gc_mode == "context_gc":
+        collected = ctx.gc()
+        assert collected == 1
+    assert ctx.stats.texture == (created + 1, freed + 1)
+
     # Buffer
     created, freed = ctx.stats.buffer
     buf = ctx.buffer(reserve=1024)
@@ -1,6 +1,10 @@
 from array import array
 
+import pytest
+from pyglet import gl
+
 import arcade
+from arcade.gl import TextureArray
 
 
 def test_create(ctx: arcade.ArcadeContext):
@@ -46,6 +50,196 @@ def test_create_individual_layers(ctx: arcade.ArcadeContext):
 
     assert ta.read() == layers.tobytes()
 
+
+def test_write_large(ctx: arcade.ArcadeContext):
+    """Layers above the pixel buffer threshold are streamed through a pooled buffer."""
+    ctx._pbo_pool.clear()
+    size = 128 * 128 * 4
+    layer_1 = array("B", [i % 256 for i in range(size)])
+    layer_2 = array("B", [255 - i % 256 for i in range(size)])
+
+    ta = ctx.texture_array((128, 128, 2), components=4, dtype="f1")
+    ta.write(layer_1, viewport=(0, 0, 0, 128, 128))
+    ta.write(layer_2, viewport=(0, 0, 1, 128, 128))
+    assert ta.read() == layer_1.tobytes() + layer_2.tobytes()
+
+    # Both uploads went through the same buffer
+    assert [buffer.size for buffer in ctx._pbo_pool] == [size]
+
+
+def test_write_raw(ctx: arcade.ArcadeContext):
+    """Write layers from ctypes memory inside an upload batch."""
+    # Rows of 3 bytes are only read correctly with an unpack alignment of 1
+    layer_1 = (gl.GLubyte * 9)(*range(9))
+    layer_2 = (gl.GLubyte * 9)(*range(9, 18))
+
+    ta = ctx.texture_array((3, 3, 2), components=1, dtype="f1")
+    ctx.begin_uploads(alignment=1)
+    try:
+        ta.write_raw(layer_1, 9, viewport=(0, 0, 0, 3, 3))
+        ta.write_raw(layer_2, 9, viewport=(0, 0, 1, 3, 3))
+    finally:
+        ctx.end_uploads()
+
+    assert ta.read() == bytes(range(18))
+
+    with pytest.raises(ValueError):
+        ta.write_raw(layer_1, 8, viewport=(0, 0, 0, 3, 3))
+
+
+def test_read_into(ctx: arcade.ArcadeContext):
+    """Read texture array data into an existing buffer."""
+    data = array("B", range(64))
+    ta = ctx.texture_array((4, 4, 4), components=1, dtype="f1", data=data)
+
+    buffer = bytearray(64)
+    ta.read_into(buffer)
+    assert buffer == data.tobytes()
+
+    with pytest.raises(ValueError):
+        ta.read_into(bytearray(32))
+
+    with pytest.raises(ValueError):
+        ta.read_into(bytes(64))
+
+
+def test_recycle(ctx: arcade.ArcadeContext):
+    """Deleted texture arrays are reused by new ones with the same format and size."""
+    # Disabled by default
+    ta = ctx.texture_array((4, 4, 4), components=1, dtype="f1")
+    ta.delete()
+    assert ctx._texture_pool_size == 0
+
+    ctx.texture_pool_max_size = 1024
+    try:
+        ta = ctx.texture_array((4, 4, 4), components=1, dtype="f1")
+        glo = ta.glo.value
+        ta.delete()
+
+        ta = ctx.texture_array((4, 4, 4), components=1, dtype="f1")
+        assert ta.glo.value == glo
+        assert ta.swizzle == "RGBA"
+
+        # Back in the pool. A different size can't take it over.
+        ta.delete()
+        other = ctx.texture_array((8, 4, 4), components=1, dtype="f1")
+        assert other.glo.value != glo
+    finally:
+        ctx.texture_pool_max_size = 0
+    # Lowering the limit frees the pooled textures
+    assert ctx._texture_pool == {}
+    assert ctx._texture_pool_size == 0
+
+
+def test_recycle_disabled(ctx: arcade.ArcadeContext):
+    """Pooled textures are not handed out once the pool limit is 0."""
+    ctx.texture_pool_max_size = 1024
+    try:
+        ta = ctx.texture_array((4, 4, 4), components=1, dtype="f1")
+        glo = ta.glo.value
+        ta.delete()
+        assert ctx._texture_pool_size == 64
+
+        # Disable without trimming so the name is still pooled
+        ctx._texture_pool_max_size = 0
+        ta = ctx.texture_array((4, 4, 4), components=1, dtype="f1")
+        assert ta.glo.value != glo
+        assert ctx._texture_pool_size == 64
+    finally:
+        ctx.flush_texture_pool()
+    assert ctx._texture_pool_size == 0
+
+
+def _param_i(ta, pname: int) -> int:
+    """Read an integer parameter of a texture array from OpenGL"""
+    value = gl.GLint()
+    gl.glBindTexture(gl.GL_TEXTURE_2D_ARRAY, ta.glo)
+    gl.glGetTexParameteriv(gl.GL_TEXTURE_2D_ARRAY, pname, value)
+    return value.value
+
+
+def test_external_bind(ctx: arcade.ArcadeContext):
+    """Changes land on the right texture after other code binds a texture array."""
+    a = ctx.texture_array((2, 2, 2), components=1, dtype="f1")
+    b = ctx.texture_array((2, 2, 2), components=1, dtype="f1")
+    dsa = ctx._ext_direct_state_access_enabled
+    ctx._ext_direct_state_access_enabled = False
+    try:
+        a.wrap_x = ctx.MIRRORED_REPEAT
+        # Bind b without the context knowing about it
+        gl.glBindTexture(gl.GL_TEXTURE_2D_ARRAY, b.glo)
+        a.wrap_x = ctx.CLAMP_TO_EDGE
+    finally:
+        ctx._ext_direct_state_access_enabled = dsa
+
+    assert _param_i(a, gl.GL_TEXTURE_WRAP_S) == ctx.CLAMP_TO_EDGE
+    assert _param_i(b, gl.GL_TEXTURE_WRAP_S) == ctx.REPEAT
+
+    # reset() forgets the tracked bindings
+    a.use(0)
+    ctx.reset()
+    assert ctx._bound_textures == {}
+
+
+def test_configure(ctx: arcade.ArcadeContext):
+    """Set several parameters with one call."""
+    ta = ctx.texture_array((2, 2, 2), components=1, dtype="f1")
+    ta.configure(
+        filter=(ctx.NEAREST, ctx.NEAREST),
+        wrap_x=ctx.CLAMP_TO_EDGE,
+        wrap_y=ctx.MIRRORED_REPEAT,
+        anisotropy=2.0,
+    )
+    assert ta.filter == (ctx.NEAREST, ctx.NEAREST)
+    assert ta.wrap_x == ctx.CLAMP_TO_EDGE
+    assert ta.wrap_y == ctx.MIRRORED_REPEAT
+    assert ta.anisotropy == min(2.0, ctx.info.MAX_TEXTURE_MAX_ANISOTROPY)
+
+    assert _param_i(ta, gl.GL_TEXTURE_MIN_FILTER) == ctx.NEAREST
+    assert _param_i(ta, gl.GL_TEXTURE_MAG_FILTER) == ctx.NEAREST
+    assert _param_i(ta, gl.GL_TEXTURE_WRAP_S) == ctx.CLAMP_TO_EDGE
+    assert _param_i(ta, gl.GL_TEXTURE_WRAP_T) == ctx.MIRRORED_REPEAT
+    if ctx.info.MAX_TEXTURE_MAX_ANISOTROPY > 1.0:
+        anisotropy = gl.GLfloat()
+        gl.glGetTexParameterfv(gl.GL_TEXTURE_2D_ARRAY, gl.GL_TEXTURE_MAX_ANISOTROPY, anisotropy)
+        assert anisotropy.value == ta.anisotropy
+
+    # Parameters that are not passed are left alone
+    ta.configure(wrap_x=ctx.REPEAT)
+    assert ta.filter == (ctx.NEAREST, ctx.NEAREST)
+    assert _param_i(ta, gl.GL_TEXTURE_WRAP_T) == ctx.MIRRORED_REPEAT
+
+
+def test_make_resident_batch(ctx: arcade.ArcadeContext):
+    """Change the residency of several bindless handles with one call."""
+    if "GL_ARB_bindless_texture" not in ctx.extensions:
+        pytest.skip("Bindless textures not supported")
+
+    textures = [ctx.texture_array((2, 2, 2), components=1, dtype="f1") for _ in range(3)]
+    # One texture already has a non-resident handle
+    handle = textures[0].get_handle(resident=False)
+
+    TextureArray.make_resident_batch(textures)
+    assert textures[0]._bindless_handle == handle
+    for ta in textures:
+        assert ta._bindless_handle is not None
+        assert ta._bindless_resident is True
+        assert gl.glIsTextureHandleResidentARB(ta._bindless_handle)
+
+    TextureArray.make_resident_batch(textures, resident=False)
+    for ta in textures:
+        assert ta._bindless_resident is False
+        assert not gl.glIsTextureHandleResidentARB(ta._bindless_handle)
+
+
+def test_slots(ctx: arcade.ArcadeContext):
+    """All state lives in __slots__. Instances have no __dict__."""
+    ta = ctx.texture_array((2, 2, 2), components=1, dtype="f1")
+    assert not hasattr(ta, "__dict__")
+    with pytest.raises(AttributeError):
+        ta.something = 1
+
+
 def test_repr(ctx: arcade.ArcadeContext):
     ta = ctx.texture_array((2, 4, 6), components=1, dtype="f1")
     assert repr(ta).startswith("<TextureArray")